@@ -5,13 +5,65 @@ Main entry point
 """
 import argparse
 import sys
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import ollama
 from colorama import Fore, Style
 
-from src import ChatBot, ToolExecutor, ui
-from src.models import Model, ModelFactory
+# Heavy dependencies (ollama/httpx, rich, prompt_toolkit through src) are imported
+# where they are needed, so that `--help` and argument errors return immediately
+if TYPE_CHECKING:
+    from src.models import Model
+
+
+def get_http_options(
+    host: Optional[str], asynchronous: bool = False
+) -> Dict[str, Any]:
+    """
+    Build the httpx options for the sync or async Ollama client
+
+    Args:
+        host: Ollama host URL
+        asynchronous: Whether the options are for the async client
+
+    Returns:
+        Keyword arguments forwarded to the underlying httpx client
+    """
+    import socket
+
+    import httpx
+
+    # HTTP/2 is negotiated through TLS ALPN, a plain-HTTP Ollama server only
+    # speaks HTTP/1.1
+    http2 = False
+    if host and host.startswith("https://"):
+        try:
+            import h2  # noqa: F401  Enables HTTP/2 in httpx
+
+            http2 = True
+        except ImportError:
+            pass
+
+    # Send streamed chunks and small requests right away instead of letting
+    # Nagle coalesce them, and keep idle pooled connections alive
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+
+    return {
+        # No read timeout: generations can be long, but fail fast on connect
+        "timeout": httpx.Timeout(None, connect=5.0),
+        "transport": transport_class(
+            # Idle time between turns is user think time, keep the connection
+            # for longer than httpx's 5 s default so each turn reuses it
+            limits=httpx.Limits(
+                max_keepalive_connections=4, max_connections=8, keepalive_expiry=900
+            ),
+            http2=http2,
+            socket_options=socket_options,
+        ),
+    }
 
 
 def setup(
@@ -30,17 +82,17 @@ def setup(
     Raises:
         SystemExit: If cannot connect to Ollama
     """
-    # Create tool executor
-    tool_executor: ToolExecutor = ToolExecutor(require_confirmation=True)
+    import ollama
 
-    ollama_client: ollama.Client = ollama.Client(host=host)
-
-    model: Optional[Model] = ModelFactory.create_model(
-        model_name, ollama_client, tool_executor
+    ollama_client: ollama.Client = ollama.Client(host=host, **get_http_options(host))
+    async_ollama_client: ollama.AsyncClient = ollama.AsyncClient(
+        host=host, **get_http_options(host, asynchronous=True)
     )
 
+    # Probe the server with the tiny /api/version endpoint before anything
+    # else touches the network, so an unreachable host fails fast.
     try:
-        ollama_models_available = ollama_client.list()
+        ollama_client._client.get("/api/version", timeout=2.0).raise_for_status()
     except Exception as e:
         print(
             f"{Fore.RED}Error: Cannot connect to Ollama. Make sure it's running.{Style.RESET_ALL}"
@@ -48,6 +100,24 @@ def setup(
         print(f"Error details: {e}")
         sys.exit(1)
 
+    # The UI stack (rich, prompt_toolkit, tools) is only loaded once the server
+    # answered, so a connection failure exits without paying for it
+    from src import ToolExecutor
+    from src.models import ModelFactory
+
+    # Create tool executor
+    tool_executor: ToolExecutor = ToolExecutor(require_confirmation=True)
+
+    model: Optional[Model] = ModelFactory.create_model(
+        model_name, ollama_client, tool_executor, async_ollama_client, host
+    )
+
+    # The model list is only needed for the welcome banner
+    try:
+        ollama_models_available = ollama_client.list()
+    except Exception:
+        ollama_models_available = ollama.ListResponse(models=[])
+
     return {
         "model": model,
         "host": host,
@@ -97,6 +167,9 @@ Examples:
         )
         sys.exit(1)
 
+    # Only loaded once Ollama answered, setup() exits early otherwise
+    from src import ChatBot, ui
+
     ui.show_welcome(
         settings["model"], settings["host"], settings["ollama_models_available"]
     )
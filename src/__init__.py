@@ -4,6 +4,18 @@ Claudette - Chat with Ollama LLM with tool support
 
 from .chatbot import ChatBot
 from .tools import ToolExecutor
-from .image_utils import extract_and_validate_images, image_to_base64
+from .image_utils import (
+    base64_to_bytes,
+    extract_and_validate_images,
+    image_to_base64,
+    remove_image_paths,
+)
 
-__all__ = ["ChatBot", "ToolExecutor", "extract_and_validate_images", "image_to_base64"]
+__all__ = [
+    "ChatBot",
+    "ToolExecutor",
+    "base64_to_bytes",
+    "extract_and_validate_images",
+    "image_to_base64",
+    "remove_image_paths",
+]
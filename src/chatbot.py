@@ -4,12 +4,12 @@ ChatBot class - Main chatbot implementation with Ollama integration
 
 import os
 from pathlib import Path
+from time import monotonic
 from typing import Dict, List, Optional, Tuple
 
 from ollama import ResponseError
 from prompt_toolkit import PromptSession
 from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
 from rich.console import Console
 from rich.live import Live
@@ -17,54 +17,35 @@ from rich.live import Live
 from . import ui
 from .commands import CommandManager
 from .completers import CommandAndFileCompleter
-from .models import Model
+from .models import Model, run_async
 from .utils import get_git_branch
+from .utils.history import BufferedFileHistory
+from .utils.paths import get_history_path
 
+# Tool results from previous turns are truncated to this many characters
+TOOL_RESULT_HISTORY_LIMIT = 4096
 
-class ChatBot:
-    """Main chatbot class with Ollama integration"""
+# Extra turns accumulated before the history is compacted back to `max_turns`
+HISTORY_TRIM_SLACK = 4
 
-    def __init__(self, model: Model) -> None:
-        """
-        Initialize the chatbot
-
-        Args:
-            model: Model instance to use for chat interactions
-        """
-        self.model: Model = model
-        self.conversation_history: List[Dict[str, any]] = []
-        self.temperature: float = 0.0
-        self.require_confirmation: bool = (
-            self.model.tool_executor.require_confirmation
-            if self.model.tool_executor
-            else True
-        )
-        self.enable_thinking: bool = False
-        self.enable_reprompting: bool = False
-        self.command_manager: CommandManager = CommandManager()
+# Share of the model context the history may fill before old turns are dropped
+HISTORY_CONTEXT_RATIO = 0.8
 
-    def _reprompt_user_message(self, user_message: str) -> str:
-        """
-        Rewrite user message to be more comprehensible for the LLM
+# Share of the model context the history is cut back to once it exceeded
+# HISTORY_CONTEXT_RATIO, so the following turns fit without another trim
+HISTORY_TRIM_TARGET_RATIO = 0.6
 
-        Args:
-            user_message: Original user message
+# Input prompt, parsed once
+PROMPT_MESSAGE = HTML('<ansi color="#9CA3AF">  → </ansi>')
 
-        Returns:
-            Rewritten user message
-        """
-        # Build the reprompting instruction with context from the main LLM's system prompt
-        llm_context = f"""
+# Reprompting instruction, `{system_prompt}` is the main LLM's system prompt
+REPROMPT_SYSTEM_PROMPT = """
 TARGET LLM SYSTEM PROMPT CONTEXT:
 The user's message will be processed by an LLM with the following system prompt constraints and capabilities:
 
-{self.model.system_prompt}
+{system_prompt}
 
----"""
-
-        reprompt_instruction = {
-            "role": "system",
-            "content": f"""{llm_context}
+---
 
 You are a prompt optimization assistant. Your task is to rewrite the user's input to make it clearer and more comprehensible for the target LLM assistant described above.
 
@@ -101,44 +82,94 @@ WRONG: "Je vais rechercher sur le web les dernières actualités..." (NEVER use
 
 Original: "Hello, how are you?"
 Rewritten: "Hello, how are you?" (unchanged - already clear)
-""",
-        }
+"""
+
+# Reprompting request wrapped around the user message
+REPROMPT_USER_PREFIX = "Reprompt, transform, keep the meaning of the user question and return only the result, nothing more: <UserMessage>"
+REPROMPT_USER_SUFFIX = "</UserMessage>"
+
+# Single words shorter than this ("ok", "thanks", "continue") are sent as is,
+# there is nothing to clarify and reprompting costs a full model round trip
+REPROMPT_MIN_LENGTH = 32
+
+
+class ChatBot:
+    """Main chatbot class with Ollama integration"""
+
+    def __init__(self, model: Model) -> None:
+        """
+        Initialize the chatbot
+
+        Args:
+            model: Model instance to use for chat interactions
+        """
+        self.model: Model = model
+        self.conversation_history: List[Dict[str, any]] = []
+        self.temperature: float = 0.0
+        self.require_confirmation: bool = (
+            self.model.tool_executor.require_confirmation
+            if self.model.tool_executor
+            else True
+        )
+        self.enable_thinking: bool = False
+        self.enable_reprompting: bool = False
+        # Number of user turns kept in the conversation history sent to the model
+        self.max_turns: int = 6
+        self.command_manager: CommandManager = CommandManager()
+        self.console: Console = ui.get_console()
+        # Messages whose token count is cached, with their counts. Messages are
+        # replaced rather than modified once in the history, so identity is enough
+        self._counted_messages: List[Dict[str, any]] = []
+        self._message_tokens: List[int] = []
+        # Reprompting system message and the system prompt it was built for
+        self._reprompt_instruction: Optional[Dict[str, str]] = None
+        self._reprompt_system_prompt: Optional[str] = None
+
+    def _reprompt_user_message(self, user_message: str) -> str:
+        """
+        Rewrite user message to be more comprehensible for the LLM
+
+        Args:
+            user_message: Original user message
+
+        Returns:
+            Rewritten user message
+        """
+        # Nothing to clarify in a single short word
+        if len(user_message) < REPROMPT_MIN_LENGTH and len(user_message.split()) <= 1:
+            return user_message
+
+        # Build the reprompting instruction with context from the main LLM's
+        # system prompt, only when that prompt changed
+        system_prompt = self.model.system_prompt
+        if (
+            self._reprompt_instruction is None
+            or self._reprompt_system_prompt != system_prompt
+        ):
+            self._reprompt_instruction = {
+                "role": "system",
+                "content": REPROMPT_SYSTEM_PROMPT.format(system_prompt=system_prompt),
+            }
+            self._reprompt_system_prompt = system_prompt
 
         temp_history = [
-            reprompt_instruction,
+            self._reprompt_instruction,
             {
                 "role": "user",
-                "content": f"Reprompt, transform, keep the meaning of the user question and return only the result, nothing more {reprompt_instruction}: <UserMessage>{user_message}</UserMessage>",
+                "content": REPROMPT_USER_PREFIX + user_message + REPROMPT_USER_SUFFIX,
             },
         ]
 
         # Use streaming call for reprompting with live animation
-        from time import time
-        from rich.live import Live
-        from rich.console import Console
-
-        start_time = time()
-        reprompted_message = ""
-
-        console = Console()
+        start_time = monotonic()
 
         # Start streaming with live animation
-        with Live(console=console, refresh_per_second=10, transient=True) as live:
-            for chunk in self.model.ollama_client.chat(
-                model=self.model.name,
-                messages=temp_history,
-                options={"temperature": 0.3},
-                stream=True,
-            ):
-                # Get content from chunk
-                message = chunk.get("message", {})
-                if content := message.get("content"):
-                    reprompted_message += content
-
-                # Update live display with animation and token count
-                ui.show_reprompting_animation(reprompted_message, live, start_time)
+        with Live(console=self.console, refresh_per_second=10, transient=True) as live:
+            reprompted_message = run_async(
+                self._stream_reprompt(temp_history, live, start_time)
+            )
 
-        elapsed_time = time() - start_time
+        elapsed_time = monotonic() - start_time
 
         # Calculate total tokens using the tokenizer
         total_tokens = ui.get_token_count(reprompted_message)
@@ -160,6 +191,53 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
 
         return reprompted_message
 
+    async def _stream_reprompt(
+        self, messages: List[Dict[str, str]], live: Live, start_time: float
+    ) -> str:
+        """
+        Stream the reprompted message from the model
+
+        Args:
+            messages: Reprompting conversation to send
+            live: Rich Live display instance
+            start_time: Monotonic time at which reprompting started
+
+        Returns:
+            The full reprompted message
+        """
+        parts: List[str] = []
+        last_refresh = start_time
+        # Tokens are counted incrementally over the parts received since the
+        # last refresh instead of re-tokenizing the whole message each time
+        token_count = 0
+        counted_parts = 0
+
+        async for chunk in await self.model.async_ollama_client.chat(
+            model=self.model.name,
+            messages=messages,
+            options={"temperature": 0.3},
+            stream=True,
+        ):
+            # Get content from chunk (a ChatResponse, attribute access is
+            # cheaper than its dict-like get())
+            if content := chunk.message.content:
+                parts.append(content)
+
+            # Update live display with animation and token count, at most
+            # every 100 ms
+            now = monotonic()
+            if now - last_refresh >= 0.1:
+                token_count += ui.get_token_count("".join(parts[counted_parts:]))
+                counted_parts = len(parts)
+                # The animation only previews the end of the message
+                ui.show_reprompting_animation(
+                    "".join(parts[-100:]), live, start_time, token_count
+                )
+                last_refresh = now
+
+        reprompted_message = "".join(parts)
+        return reprompted_message
+
     def chat(self, live: Live, user_message: str) -> Tuple[str, float, str]:
         """
         Send a message and get response with tool support
@@ -180,9 +258,120 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
 
         self.conversation_history.append(struct_message)
 
-        return self.model.process_message(
+        result = self.model.process_message(
             self.conversation_history, live, self.temperature, self.enable_thinking
         )
+        self._trim_history()
+        return result
+
+    def _get_message_token_counts(self) -> List[int]:
+        """
+        Get the token count of each message of the conversation history
+
+        Counts are reused for the unchanged prefix of the history, only the
+        messages added or replaced since the last call are tokenized.
+
+        Returns:
+            List of token counts, one per message
+        """
+        history = self.conversation_history
+        counted = self._counted_messages
+        prefix = 0
+        limit = min(len(history), len(counted))
+        while prefix < limit and history[prefix] is counted[prefix]:
+            prefix += 1
+
+        if prefix < len(history) or len(counted) != len(history):
+            self._message_tokens = self._message_tokens[:prefix] + [
+                ui.get_token_count(ui.serialize_message_for_tokens(msg))
+                for msg in history[prefix:]
+            ]
+            self._counted_messages = list(history)
+        return self._message_tokens
+
+    def _trim_history(self, force: bool = False) -> int:
+        """
+        Bound the conversation history sent to the model on each request
+
+        Once the history holds more than `max_turns + HISTORY_TRIM_SLACK` turns, it
+        is cut back to the system prompt plus the last `max_turns` turns. Once it
+        exceeds HISTORY_CONTEXT_RATIO of the model context, older turns are also
+        dropped until it fits in HISTORY_TRIM_TARGET_RATIO of it (the latest turn
+        is always kept), leaving room for the next turns. A turn starts at a user
+        message, so assistant tool calls are never separated from their tool
+        results. Tool results of the kept turns are truncated, the model has
+        already consumed their full content.
+
+        Between two compactions messages are only appended, so the prompt prefix
+        stays byte-identical and Ollama can reuse its KV cache.
+
+        Args:
+            force: Cut back to the last `max_turns` turns right away, without
+                waiting for the slack to be used
+
+        Returns:
+            Number of messages removed from the history
+        """
+        history = self.conversation_history
+        user_indices = [
+            idx for idx, msg in enumerate(history) if msg.get("role") == "user"
+        ]
+        if not user_indices:
+            return 0
+
+        head = history[:1] if history[0].get("role") == "system" else []
+        start = 0
+        max_turns = self.max_turns if force else self.max_turns + HISTORY_TRIM_SLACK
+        if len(user_indices) > max_turns:
+            start = user_indices[-self.max_turns]
+
+        # Token budget: once exceeded, keep the longest suffix of turns that fits
+        # the lower target
+        budget = int(self.model.max_token_context * HISTORY_CONTEXT_RATIO)
+        target = int(self.model.max_token_context * HISTORY_TRIM_TARGET_RATIO)
+        message_tokens = self._get_message_token_counts()
+        if sum(message_tokens) > budget:
+            head_tokens = sum(message_tokens[: len(head)])
+            # Only turns the turn cap keeps are candidates, oldest first
+            turn_start = start
+            start = max(start, user_indices[-1])
+            for idx in (i for i in user_indices if i >= turn_start):
+                if idx >= start:
+                    break
+                if head_tokens + sum(message_tokens[idx:]) <= target:
+                    start = idx
+                    break
+
+        if not start:
+            return 0
+        removed = start - len(head)
+        history = head + history[start:]
+
+        for idx, msg in enumerate(history):
+            content = msg.get("content")
+            if (
+                msg.get("role") == "tool"
+                and isinstance(content, str)
+                and len(content) > TOOL_RESULT_HISTORY_LIMIT
+            ):
+                history[idx] = {
+                    **msg,
+                    "content": content[:TOOL_RESULT_HISTORY_LIMIT]
+                    + f"\n... [truncated {len(content) - TOOL_RESULT_HISTORY_LIMIT} characters]",
+                }
+
+        self.conversation_history = history
+        return removed
+
+    def compact_history(self) -> int:
+        """
+        Compact the conversation history now, as done automatically once the
+        turn slack or the context budget is exceeded
+
+        Returns:
+            Number of messages removed from the history
+        """
+        return self._trim_history(force=True)
 
     def manage_user_input(self, user_input: str) -> Optional[str]:
         """
@@ -214,7 +403,6 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
         )
 
         # Setup history file using XDG paths
-        from .utils.paths import get_history_path
         history_file: Path = get_history_path()
         history_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -229,28 +417,31 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
         def _(event):
             event.current_buffer.insert_text("\n")
 
+        # Submitted inputs are written to the history file in batches
+        history: BufferedFileHistory = BufferedFileHistory(str(history_file))
         session: PromptSession = PromptSession(
-            history=FileHistory(str(history_file)),
+            history=history,
             completer=combined_completer,
             complete_while_typing=True,
             key_bindings=kb,
         )
         self.conversation_history.append(self.model.get_system_prompt())
-        console: Console = Console()
 
-        # Create bottom toolbar function
+        # Create bottom toolbar function. Everything it shows only changes
+        # between two prompts (commands, chat turns), so it is built once per
+        # prompt rather than on every redraw/keystroke
         def get_bottom_toolbar():
-            token_count = ui.get_conversation_token_count(self.conversation_history)
+            token_count = sum(self._get_message_token_counts())
+            cwd = os.getcwd()
+            branch = get_git_branch()
 
             # Build toolbar components
             toolbar_parts = []
 
             # Add current directory with folder emoji (full path)
-            cwd = os.getcwd()
             toolbar_parts.append(f"📁 {cwd}")
 
             # Add git branch if available with branch emoji
-            branch = get_git_branch()
             if branch:
                 toolbar_parts.append(f"🌿 {branch}")
 
@@ -312,8 +503,8 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
             try:
                 # Minimal modern prompt with bottom toolbar and autocompletion
                 user_input = session.prompt(
-                    HTML('<ansi color="#9CA3AF">  → </ansi>'),
-                    bottom_toolbar=get_bottom_toolbar,
+                    PROMPT_MESSAGE,
+                    bottom_toolbar=get_bottom_toolbar(),
                     multiline=True,
                 ).strip()
 
@@ -326,15 +517,19 @@ Rewritten: "Hello, how are you?" (unchanged - already clear)
                 try:
                     # Get response from the chatbot
                     with Live(
-                        console=console, refresh_per_second=10, transient=True
+                        console=self.console, refresh_per_second=10, transient=True
                     ) as live:
                         response, elapsed, thinking_content = self.chat(
                             live, user_input
                         )
-                        ui.show_response(console, elapsed, response, thinking_content)
+                        ui.show_response(
+                            self.console, elapsed, response, thinking_content
+                        )
                 except ResponseError as e:
                     ui.show_error(f"Model {self.model.name} not found! {e}")
 
             except KeyboardInterrupt:
                 ui.show_goodbye()
                 break
+
+        history.flush()
@@ -33,19 +33,14 @@ class CdCommand(Command):
             if not os.path.isabs(target_dir):
                 target_dir = os.path.abspath(target_dir)
 
-            # Check if directory exists
-            if not os.path.exists(target_dir):
-                ui.show_error(f"Directory not found: {target_dir}")
-                return None
-
-            if not os.path.isdir(target_dir):
-                ui.show_error(f"Not a directory: {target_dir}")
-                return None
-
-            # Change directory
+            # Change directory, chdir reports missing paths and files itself
             os.chdir(target_dir)
             ui.show_info(f"Changed directory to: {os.getcwd()}")
 
+        except FileNotFoundError:
+            ui.show_error(f"Directory not found: {target_dir}")
+        except NotADirectoryError:
+            ui.show_error(f"Not a directory: {target_dir}")
         except PermissionError:
             ui.show_error(f"Permission denied: {target_dir}")
         except Exception as e:
@@ -0,0 +1,27 @@
+"""
+Compact command - Drop old turns from the conversation history
+"""
+
+from .base import Command
+from .. import ui
+
+
+class CompactCommand(Command):
+    """Keep only the most recent turns of the conversation history"""
+
+    def __init__(self):
+        super().__init__(
+            name="compact",
+            description="Keep only the most recent turns of the conversation",
+            usage="/compact",
+        )
+
+    def execute(self, chatbot, args):
+        removed = chatbot.compact_history()
+        if removed:
+            ui.show_success(
+                f"Removed {removed} messages, kept the last {chatbot.max_turns} turns"
+            )
+        else:
+            ui.show_info("Nothing to compact")
+        return None
@@ -5,6 +5,7 @@ Conversations command - List saved conversations
 import os
 from .base import Command
 from .. import ui
+from ..utils.paths import get_conversations_dir
 
 
 class ConversationsCommand(Command):
@@ -19,28 +20,26 @@ class ConversationsCommand(Command):
 
     def execute(self, chatbot, args):
         try:
-            from ..utils.paths import get_conversations_dir
             conversations_dir = str(get_conversations_dir())
 
-            if not os.path.exists(conversations_dir):
-                ui.show_error(f"No conversations directory found: {conversations_dir}")
-                return None
-
-            # Get list of conversation files
+            # Get list of conversation files, directory entries carry their
+            # type and cache their stat
             conversation_files = []
-            for filename in os.listdir(conversations_dir):
-                if filename.endswith(".yaml"):
-                    filepath = os.path.join(conversations_dir, filename)
-                    stat = os.stat(filepath)
-                    conversation_files.append(
-                        {
-                            "name": filename,
-                            "size": stat.st_size,
-                            "modified": stat.st_mtime,
-                        }
-                    )
+            with os.scandir(conversations_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".yaml") and entry.is_file():
+                        stat = entry.stat()
+                        conversation_files.append(
+                            {
+                                "name": entry.name,
+                                "size": stat.st_size,
+                                "modified": stat.st_mtime,
+                            }
+                        )
 
             ui.show_conversations_list(conversation_files)
+        except FileNotFoundError:
+            ui.show_error(f"No conversations directory found: {conversations_dir}")
         except Exception as e:
             ui.show_error(f"Failed to list conversations: {e}")
         return None
@@ -2,13 +2,23 @@
 Edit Prompt command - Modify the current system prompt
 """
 
+import copy
 import os
 import tempfile
 import subprocess
-from rich.console import Console
+import yaml
 from rich.prompt import Confirm
+
+try:
+    # LibYAML C bindings, much faster than the pure Python emitter
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 from .base import Command
 from .. import ui
+from ..models import load_yaml_cached
+from ..utils.paths import get_models_config_path
 
 
 class EditPromptCommand(Command):
@@ -22,7 +32,7 @@ class EditPromptCommand(Command):
         )
 
     def execute(self, chatbot, args):
-        console = Console()
+        console = ui.get_console()
         console.print()
 
         # Get the current system prompt
@@ -37,7 +47,7 @@ class EditPromptCommand(Command):
 
         # Create a temporary file with the current prompt
         with tempfile.NamedTemporaryFile(
-            mode="w+", suffix=".txt", delete=False
+            mode="w", encoding="utf-8", suffix=".txt", delete=False
         ) as tmp_file:
             tmp_file.write(current_prompt)
             tmp_path = tmp_file.name
@@ -51,7 +61,7 @@ class EditPromptCommand(Command):
             subprocess.run([editor, tmp_path], check=True)
 
             # Read the modified content
-            with open(tmp_path, "r") as f:
+            with open(tmp_path, "r", encoding="utf-8") as f:
                 new_prompt = f.read()
 
             # Check if there are changes
@@ -60,8 +70,8 @@ class EditPromptCommand(Command):
                 return None
 
             # Show diff statistics
-            old_tokens = ui.get_token_count(current_prompt)
-            new_tokens = ui.get_token_count(new_prompt)
+            old_tokens = ui.get_cached_token_count(current_prompt)
+            new_tokens = ui.get_cached_token_count(new_prompt)
             token_diff = new_tokens - old_tokens
             diff_sign = "+" if token_diff > 0 else ""
 
@@ -109,23 +119,21 @@ class EditPromptCommand(Command):
                 self._save_to_config(chatbot.model.name, new_prompt)
 
         finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
+            # Clean up temporary file, the editor may have removed it already
+            try:
                 os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
 
         return None
 
     def _save_to_config(self, model_name, new_prompt):
         """Save the new prompt to the models_config.yaml file"""
-        import yaml
-        from ..utils.paths import get_models_config_path
-
         config_path = get_models_config_path()
 
         try:
-            # Read current config
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            # Read current config, copied as the cached one is shared
+            config = copy.deepcopy(load_yaml_cached(str(config_path)))
 
             # Update the model's system_prompt (base prompt only, not merged)
             if "models" in config and model_name in config["models"]:
@@ -136,6 +144,7 @@ class EditPromptCommand(Command):
                     yaml.dump(
                         config,
                         f,
+                        Dumper=YamlDumper,
                         default_flow_style=False,
                         allow_unicode=True,
                         width=80,
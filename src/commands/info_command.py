@@ -4,6 +4,7 @@ Info command - Show model information
 
 from .base import Command
 from .. import ui
+from ..models import get_model_details
 
 
 class InfoCommand(Command):
@@ -25,7 +26,9 @@ class InfoCommand(Command):
 
         try:
             # Get model info from Ollama
-            model_info = chatbot.model.ollama_client.show(model_name)
+            model_info = get_model_details(
+                chatbot.model.ollama_client, chatbot.model.host, model_name
+            )
             ui.show_model_info(model_name, model_info)
 
         except Exception as e:
@@ -2,7 +2,6 @@
 Init command - Generate AGENTS.md file
 """
 
-from rich.console import Console
 from rich.live import Live
 from .base import Command
 from .. import ui
@@ -19,7 +18,7 @@ class InitCommand(Command):
         )
 
     def execute(self, chatbot, args):
-        console = Console()
+        console = ui.get_console()
 
         # Show start message
         ui.show_info("🚀 Starting project analysis for AGENTS.md generation...")
@@ -2,12 +2,13 @@
 Command Manager - Manages all commands and their execution
 """
 
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 from .base import Command
 
 # Import all command classes
 from .cd_command import CdCommand
 from .clear_command import ClearCommand
+from .compact_command import CompactCommand
 from .conversations_command import ConversationsCommand
 from .edit_prompt_command import EditPromptCommand
 from .exit_command import ExitCommand, QuitCommand
@@ -38,6 +39,8 @@ class CommandManager:
     def __init__(self):
         """Initialize the command manager and register all commands"""
         self.commands: Dict[str, Command] = {}
+        # Sorted command names with / prefix, built on first request
+        self._command_names: Optional[List[str]] = None
         self._register_commands()
 
     def _register_commands(self):
@@ -45,6 +48,7 @@ class CommandManager:
         commands = [
             CdCommand(),
             ClearCommand(),
+            CompactCommand(),
             ConversationsCommand(),
             EditPromptCommand(),
             ExitCommand(),
@@ -70,10 +74,13 @@ class CommandManager:
 
         for command in commands:
             self.commands[command.name] = command
+        self._command_names = None
 
     def get_command_names(self) -> List[str]:
-        """Get a sorted list of all command names with / prefix"""
-        return sorted([f"/{name}" for name in self.commands.keys()])
+        """Get a sorted list of all command names with / prefix (do not mutate it)"""
+        if self._command_names is None:
+            self._command_names = sorted(f"/{name}" for name in self.commands)
+        return self._command_names
 
     def execute_command(self, command_input: str, chatbot: "ChatBot") -> str | None:
         """
@@ -91,17 +98,17 @@ class CommandManager:
         if not command_input.startswith("/"):
             return command_input
 
-        # Parse command and arguments
+        # Parse command name, arguments are only split for known commands.
+        # Any whitespace separates them, multiline input may use a newline
         parts = command_input[1:].split(maxsplit=1)
-        command_name = parts[0]
-        args = parts[1].split() if len(parts) > 1 else []
+        command = self.commands.get(parts[0]) if parts else None
 
         # Check if command exists
-        if command_name not in self.commands:
+        if command is None:
             return command_input
 
         # Execute command
-        command = self.commands[command_name]
+        args = parts[1].split() if len(parts) > 1 else []
         return command.execute(chatbot, args)
 
     def get_command(self, name: str) -> Command | None:
@@ -2,12 +2,16 @@
 Model command - Switch model
 """
 
-from time import sleep
+from time import monotonic, sleep
 from .base import Command
 from .. import ui
 from ..tools import ToolExecutor
 from ..models import ModelFactory
 
+# Longest wait for Ollama to release the previous model, and polling interval
+UNLOAD_TIMEOUT = 2.0
+UNLOAD_POLL_INTERVAL = 0.05
+
 
 class ModelCommand(Command):
     """Switch to a different model"""
@@ -31,7 +35,7 @@ class ModelCommand(Command):
             chatbot.model.ollama_client.generate(model=chatbot.model.name, keep_alive=0)
             ui.show_clear_confirmation()
             ui.show_model_unload_start()
-            sleep(2)
+            self._wait_for_unload(chatbot.model.ollama_client, chatbot.model.name)
         except Exception as e:
             ui.show_error(f"Failed to unload model: {e}")
 
@@ -42,6 +46,8 @@ class ModelCommand(Command):
             tool_executor=ToolExecutor(
                 require_confirmation=chatbot.require_confirmation
             ),
+            async_ollama_client=chatbot.model.async_ollama_client,
+            host=chatbot.model.host,
         )
 
         if new_model is None:
@@ -52,3 +58,19 @@ class ModelCommand(Command):
         chatbot.conversation_history = [chatbot.model.get_system_prompt()]
         ui.show_model_switch_success(new_model_name)
         return "Hello! (don't use tools to answer this first message only, no asking necessary, a simple welcome is perfect)"
+
+    @staticmethod
+    def _wait_for_unload(ollama_client, model_name: str) -> None:
+        """
+        Wait until Ollama no longer lists a model as running
+
+        Args:
+            ollama_client: Ollama client instance
+            model_name: Name of the model being unloaded
+        """
+        deadline = monotonic() + UNLOAD_TIMEOUT
+        while monotonic() < deadline:
+            running = ollama_client.ps().models
+            if not any(model_name in (m.model, m.name) for m in running):
+                return
+            sleep(UNLOAD_POLL_INTERVAL)
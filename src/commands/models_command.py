@@ -9,11 +9,11 @@ from .. import ui
 class ModelsCommand(Command):
     """List all available models"""
 
-    def __init__(self):
+    def __init__(self, name: str = "models", usage: str = "/models or /list"):
         super().__init__(
-            name="models",
+            name=name,
             description="List all available models",
-            usage="/models or /list",
+            usage=usage,
         )
 
     def execute(self, chatbot, args):
@@ -25,20 +25,8 @@ class ModelsCommand(Command):
         return None
 
 
-class ListCommand(Command):
+class ListCommand(ModelsCommand):
     """List all available models (alias for /models)"""
 
     def __init__(self):
-        super().__init__(
-            name="list",
-            description="List all available models",
-            usage="/list or /models",
-        )
-
-    def execute(self, chatbot, args):
-        try:
-            models_response = chatbot.model.ollama_client.list()
-            ui.show_models_list(models_response)
-        except Exception as e:
-            ui.show_error(f"Failed to list models: {e}")
-        return None
+        super().__init__(name="list", usage="/list or /models")
@@ -2,7 +2,6 @@
 Prompt command - Display system prompt
 """
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich import box
@@ -21,7 +20,7 @@ class PromptCommand(Command):
         )
 
     def execute(self, chatbot, args):
-        console = Console()
+        console = ui.get_console()
         console.print()
 
         # Get the system prompt from the model
@@ -44,9 +43,7 @@ class PromptCommand(Command):
         console.print()
 
         # Show prompt statistics
-        from .. import ui as ui_module
-
-        token_count = ui_module.get_token_count(system_prompt)
+        token_count = ui.get_cached_token_count(system_prompt)
         char_count = len(system_prompt)
         lines_count = system_prompt.count("\n") + 1
 
@@ -2,7 +2,6 @@
 Pull command - Download a model from Ollama
 """
 
-from rich.console import Console
 from rich.progress import (
     Progress,
     SpinnerColumn,
@@ -14,6 +13,7 @@ from rich.progress import (
 )
 from .base import Command
 from .. import ui
+from ..models import forget_model_details
 
 
 class PullCommand(Command):
@@ -35,7 +35,7 @@ class PullCommand(Command):
         ui.show_pull_start(model_name)
 
         try:
-            console = Console()
+            console = ui.get_console()
 
             with Progress(
                 SpinnerColumn(),
@@ -56,6 +56,7 @@ class PullCommand(Command):
                     elif "status" in chunk:
                         progress.update(task, description=f"{chunk['status']}")
 
+            forget_model_details(chatbot.model.host, model_name)
             ui.show_pull_success(model_name)
 
         except Exception as e:
@@ -2,11 +2,11 @@
 Stats Command - Display usage statistics
 """
 
-from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
 from .base import Command
+from .. import ui
 from ..utils import StatsManager
 
 
@@ -30,7 +30,7 @@ class StatsCommand(Command):
             stats = stats_manager.get_stats(model_name)
 
             if not stats:
-                console = Console()
+                console = ui.get_console()
                 console.print()
                 error_text = Text()
                 error_text.append("  ⚠️ ", style="bold #EF4444")
@@ -47,7 +47,7 @@ class StatsCommand(Command):
             all_stats = stats_manager.get_stats()
 
             if not all_stats:
-                console = Console()
+                console = ui.get_console()
                 console.print()
                 info_text = Text()
                 info_text.append("  ℹ️  ", style="bold #3B82F6")
@@ -65,7 +65,7 @@ class StatsCommand(Command):
 
     def _display_single_model_stats(self, model_name: str, stats: dict):
         """Display statistics for a single model"""
-        console = Console()
+        console = ui.get_console()
         console.print()
 
         # Header
@@ -143,7 +143,7 @@ class StatsCommand(Command):
 
     def _display_all_models_stats(self, all_stats: dict):
         """Display statistics for all models in a table"""
-        console = Console()
+        console = ui.get_console()
         console.print()
 
         # Header
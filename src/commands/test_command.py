@@ -10,12 +10,11 @@ import signal
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from time import time
+from time import monotonic
 from .base import Command
 from .. import ui
 
@@ -57,7 +56,7 @@ class TestCommand(Command):
         self.timeout_seconds = 300  # 5 minutes timeout per test
 
     def execute(self, chatbot, args):
-        console = Console()
+        console = ui.get_console()
 
         # Determine which category to test
         if args:
@@ -165,7 +164,7 @@ class TestCommand(Command):
         temp_message = chatbot.model.get_user_message(prompt)
         temp_history.append(temp_message)
 
-        start_time = time()
+        start_time = monotonic()
         response = None
 
         try:
@@ -177,13 +176,13 @@ class TestCommand(Command):
                         temp_history, live, temperature=0, enable_thinking=False
                     )
         except TimeoutException as e:
-            elapsed = time() - start_time
+            elapsed = monotonic() - start_time
             return None, elapsed, str(e)
         except Exception as e:
-            elapsed = time() - start_time
+            elapsed = monotonic() - start_time
             return None, elapsed, str(e)
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
         return response, elapsed, None
 
     def _test_workflow_complex(self, chatbot, console):
@@ -1000,7 +999,7 @@ Use the execute_command tool or similar to accomplish this."""
         temp_message = chatbot.model.get_user_message(prompt)
         temp_history.append(temp_message)
 
-        start_time = time()
+        start_time = monotonic()
         tool_called = False
         tool_name_used = None
 
@@ -1021,11 +1020,11 @@ Use the execute_command tool or similar to accomplish this."""
                             tool_name_used = tool_call["function"]["name"]
                             break
         except TimeoutException as e:
-            elapsed = time() - start_time
+            elapsed = monotonic() - start_time
             console.print(f"[red]✗ TIMEOUT: {e}[/red]\n")
             return {"score": 0, "max_score": 100, "percentage": 0, "elapsed": elapsed}
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         criteria = {
             "Tool was called": tool_called,
@@ -1095,7 +1094,7 @@ Use the execute_command tool or similar to accomplish this."""
             },
         ]
 
-        start_time = time()
+        start_time = monotonic()
         results = []
 
         for i, test_case in enumerate(test_cases, 1):
@@ -1140,7 +1139,7 @@ Use the execute_command tool or similar to accomplish this."""
                 results.append(False)
                 console.print(f"  Test {i}: [red]✗ TIMEOUT[/red]\n")
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         score = int((sum(results) / len(results)) * 100) if results else 0
         percentage = score
@@ -1191,7 +1190,7 @@ Use the execute_command tool or similar to accomplish this."""
             },
         ]
 
-        start_time = time()
+        start_time = monotonic()
         results = []
 
         for i, test_case in enumerate(test_cases, 1):
@@ -1243,7 +1242,7 @@ Use the execute_command tool or similar to accomplish this."""
                 results.append(False)
                 console.print(f"  Test {i}: [red]✗ TIMEOUT[/red]\n")
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         score = int((sum(results) / len(results)) * 100) if results else 0
         percentage = score
@@ -1289,7 +1288,7 @@ Use tools for each step and explain what you're doing."""
         temp_message = chatbot.model.get_user_message(prompt)
         temp_history.append(temp_message)
 
-        start_time = time()
+        start_time = monotonic()
         tools_called = []
 
         try:
@@ -1308,11 +1307,11 @@ Use tools for each step and explain what you're doing."""
                                 tools_called.append(tool_call["function"]["name"])
 
         except TimeoutException as e:
-            elapsed = time() - start_time
+            elapsed = monotonic() - start_time
             console.print(f"[red]✗ TIMEOUT: {e}[/red]\n")
             return {"score": 0, "max_score": 100, "percentage": 0, "elapsed": elapsed}
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         criteria = {
             "At least 3 tool calls": len(tools_called) >= 3,
@@ -1369,7 +1368,7 @@ Use tools for each step and explain what you're doing."""
             "Explain what Python is in one sentence.",
         ]
 
-        start_time = time()
+        start_time = monotonic()
         results = []
 
         for i, test_prompt in enumerate(test_cases, 1):
@@ -1408,7 +1407,7 @@ Use tools for each step and explain what you're doing."""
                 results.append(False)
                 console.print(f"  Test {i}: [red]✗ TIMEOUT[/red]\n")
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         score = int((sum(results) / len(results)) * 100) if results else 0
         percentage = score
@@ -1453,7 +1452,7 @@ Use tools for each step and explain what you're doing."""
             },
         ]
 
-        start_time = time()
+        start_time = monotonic()
         results = []
 
         for i, test_case in enumerate(test_cases, 1):
@@ -1489,7 +1488,7 @@ Use tools for each step and explain what you're doing."""
                 results.append(False)
                 console.print(f"  Test {i}: [red]✗ TIMEOUT[/red]\n")
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         score = int((sum(results) / len(results)) * 100) if results else 0
         percentage = score
@@ -1707,7 +1706,7 @@ Think about which single command could accomplish this."""
         temp_message = chatbot.model.get_user_message(prompt)
         temp_history.append(temp_message)
 
-        start_time = time()
+        start_time = monotonic()
         tool_count = 0
 
         try:
@@ -1725,14 +1724,14 @@ Think about which single command could accomplish this."""
                             tool_count += len(msg["tool_calls"])
 
         except TimeoutException as e:
-            elapsed = time() - start_time
+            elapsed = monotonic() - start_time
             console.print(
                 f"[red]✗ TIMEOUT: {e}[/red]\
 "
             )
             return {"score": 0, "max_score": 100, "percentage": 0, "elapsed": elapsed}
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         # Optimal is 1 tool call (ls *.txt | wc -l or similar)
         criteria = {
@@ -2560,7 +2559,7 @@ For each:
         question = "What is the capital of Italy?"
 
         responses = []
-        start_time = time()
+        start_time = monotonic()
 
         for i in range(3):
             temp_history = [chatbot.model.get_system_prompt()]
@@ -2579,7 +2578,7 @@ For each:
             except TimeoutException:
                 responses.append("")
 
-        elapsed = time() - start_time
+        elapsed = monotonic() - start_time
 
         # Check consistency
         all_mention_rome = all("rome" in r.lower() for r in responses if r)
@@ -3,7 +3,6 @@ Custom completers for Claudette
 """
 
 import os
-from typing import Iterable
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
@@ -7,6 +7,12 @@ from typing import Any, Dict
 import yaml
 from colorama import Fore, Style
 
+try:
+    # LibYAML C bindings, much faster than the pure Python parser
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Default configuration constants
 DEFAULT_CONFIG: Dict[str, Any] = {
     "model": "llama3.1",
@@ -28,7 +34,7 @@ def load_config() -> Dict[str, Any]:
     """
     try:
         with open("config.yaml", "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
             return config if config else DEFAULT_CONFIG.copy()
     except FileNotFoundError:
         # Return default configuration
@@ -1,7 +1,8 @@
-from time import time
+from time import monotonic
 from typing import Dict
 from collections import Counter
 from datetime import datetime
+import asyncio
 import os
 
 import ollama
@@ -10,10 +11,118 @@ import json
 import re
 from rich.live import Live
 
+try:
+    # LibYAML C bindings, much faster than the pure Python parser
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from .tools import ToolExecutor
 from . import ui
-from .image_utils import extract_and_validate_images
+from .image_utils import (
+    base64_to_bytes,
+    extract_and_validate_images,
+    remove_image_paths,
+)
 from .utils import StatsManager
+from .utils.paths import get_models_config_path
+
+# Tool call fallbacks, applied to every plain-text response when tools are enabled
+# Function calls written as text: function_name('arg') or function_name("arg")
+# Supports single or double quotes, and handles escaped quotes
+FUNCTION_CALL_TEXT_PATTERN = re.compile(
+    r"(\w+)\s*\(\s*['\"]([^'\"]*)['\"](?:\s*,\s*(\{.*?\}))?\s*\)", re.DOTALL
+)
+# Function calls removed from the content once parsed: web_search('query')
+FUNCTION_CALL_CLEANUP_PATTERN = re.compile(r'\b\w+\s*\(\s*[\'"][^\'"]*[\'"]\s*\)')
+# XML-like tool calls: <function=tool_name>{"arg": "value"}</tool_call>
+XML_TOOL_CALL_PATTERN = re.compile(
+    r"<function=([^>]+)>\s*(.*?)\s*</tool_call>", re.DOTALL
+)
+
+# Shared event loop for the async Ollama client. It is kept alive between turns so
+# that the httpx connection pool (bound to the loop) can be reused.
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the shared event loop
+
+    If the wait is interrupted (Ctrl+C, a signal handler raising such as the
+    /test timeout), the coroutine is cancelled before the exception propagates,
+    so it does not resume on the loop during a later call.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    task = _event_loop.create_task(coro)
+    try:
+        return _event_loop.run_until_complete(task)
+    except BaseException:
+        if not task.done():
+            task.cancel()
+            try:
+                _event_loop.run_until_complete(task)
+            except (asyncio.CancelledError, Exception):
+                pass
+        raise
+
+
+# Responses of Ollama's `show` endpoint, keyed by host and model name
+_model_details_cache: dict = {}
+
+
+# Parsed YAML files, keyed by path, with the modification time and size they
+# were read at
+_yaml_cache: dict = {}
+
+
+def load_yaml_cached(path: str):
+    """
+    Load a YAML file, reusing the parsed content while the file is unchanged
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content (shared between calls, do not mutate it)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        content = yaml.load(f, Loader=YamlLoader)
+    _yaml_cache[path] = (key, content)
+    return content
+
+
+def get_model_details(ollama_client: ollama.Client, host: str | None, model_name: str):
+    """
+    Get a model's details from Ollama, cached for the session
+
+    Args:
+        ollama_client: Ollama client instance
+        host: Ollama host URL the client was created with
+        model_name: Name of the model
+
+    Returns:
+        Ollama `show` response for the model
+    """
+    key = (host, model_name)
+    if key not in _model_details_cache:
+        _model_details_cache[key] = ollama_client.show(model_name)
+    return _model_details_cache[key]
+
+
+def forget_model_details(host: str | None, model_name: str) -> None:
+    """Drop a model's cached details, e.g. after it was pulled again"""
+    _model_details_cache.pop((host, model_name), None)
 
 
 class Model:
@@ -26,14 +135,31 @@ class Model:
         system_prompt: str,
         ollama_client: ollama.Client,
         max_token_context: int,
+        async_ollama_client: ollama.AsyncClient | None = None,
+        host: str | None = None,
     ) -> None:
         self.name = name
         self.image_mode = image_mode
         self.tool_executor = tool_executor
+        # Tool definitions never change for a model instance: validate them once into
+        # ollama Tool models (sorted by name) instead of on every request, so every
+        # request carries the same schema block
+        self._tools = (
+            [ollama.Tool.model_validate(tool) for tool in tool_executor.tools_definition]
+            if tool_executor
+            else None
+        )
         self.system_prompt = system_prompt
         self.ollama_client = ollama_client
+        self.host = host
+        self.async_ollama_client = async_ollama_client or ollama.AsyncClient(host=host)
         self.max_token_context = max_token_context
         self.stats_manager = StatsManager()
+        # Last system message, with the date and system prompt it was built for
+        self._system_message: dict | None = None
+        self._system_message_key: tuple | None = None
+        # Decoded images of the history, keyed by their base64 string
+        self._image_bytes: Dict[str, bytes] = {}
 
     def _get_max_thinking_tokens(self) -> int:
         """
@@ -125,13 +251,7 @@ class Model:
         Returns:
             dict with 'function' key containing 'name' and 'arguments', or None if not found
         """
-        import re
-
-        # Pattern to match function calls: function_name('arg') or function_name("arg")
-        # Supports single or double quotes, and handles escaped quotes
-        pattern = r"(\w+)\s*\(\s*['\"]([^'\"]*)['\"](?:\s*,\s*(\{.*?\}))?\s*\)"
-
-        matches = re.finditer(pattern, content, re.DOTALL)
+        matches = FUNCTION_CALL_TEXT_PATTERN.finditer(content)
 
         for match in matches:
             func_name = match.group(1)
@@ -219,8 +339,7 @@ class Model:
             return None
 
         # Try to parse XML-like format: <function=tool_name>...</tool_call>
-        xml_pattern = r"<function=([^>]+)>\s*(.*?)\s*</tool_call>"
-        xml_match = re.search(xml_pattern, content, re.DOTALL)
+        xml_match = XML_TOOL_CALL_PATTERN.search(content)
         if xml_match:
             tool_name = xml_match.group(1).strip()
             args_str = xml_match.group(2).strip()
@@ -281,7 +400,7 @@ class Model:
 
         return None
 
-    def get_stream(
+    async def get_stream(
         self,
         conversation_history: list,
         keep_alive_duration: str = "15m",
@@ -289,16 +408,33 @@ class Model:
         max_tokens: int | None = None,
         enable_thinking: bool = True,
     ):
+        """
+        Open a streamed chat request for the conversation
+
+        Streaming is mandatory: Ollama's non-streamed path only returns once the
+        whole generation is done, which can take minutes on large models with no
+        feedback, and callers accumulate chunks themselves anyway.
+
+        Args:
+            conversation_history: Messages to send
+            keep_alive_duration: How long Ollama keeps the model loaded
+            temperature: Sampling temperature
+            max_tokens: Optional hard limit on generated tokens
+            enable_thinking: Whether to request the model's thinking
+
+        Returns:
+            Async iterator over the response chunks
+        """
         options = {"temperature": temperature}
 
         # Add max token limit if specified
         if max_tokens:
             options["num_predict"] = max_tokens
 
-        stream = self.ollama_client.chat(
+        stream = await self.async_ollama_client.chat(
             model=self.name,
-            messages=conversation_history,
-            tools=self.tool_executor.tools_definition if self.tool_executor else None,
+            messages=self._request_messages(conversation_history),
+            tools=self._tools,
             stream=True,
             keep_alive=keep_alive_duration,
             options=options,
@@ -306,18 +442,47 @@ class Model:
         )
         return stream
 
+    def _request_messages(self, conversation_history: list) -> list:
+        """
+        Prepare the history for a chat request
+
+        The ollama client validates base64 image strings on every request by
+        trying them as file paths and decoding them, while raw bytes are only
+        encoded. Each image is therefore decoded once, the first time it is
+        sent, and its bytes are reused for the following requests as long as it
+        stays in the history. The history itself keeps the base64 strings.
+        """
+        cached = self._image_bytes
+        image_bytes = {}
+        messages = []
+        for message in conversation_history:
+            if isinstance(message, dict) and message.get("images"):
+                images = []
+                for image in message["images"]:
+                    data = cached.get(image)
+                    if data is None:
+                        data = base64_to_bytes(image)
+                    image_bytes[image] = data
+                    images.append(data)
+                message = {**message, "images": images}
+            messages.append(message)
+        # Forget images that left the history
+        self._image_bytes = image_bytes
+        return messages
+
     def _track_and_return(
         self,
         conversation_history: list,
-        tokens_before: int,
+        history_length: int,
         elapsed_time: float,
         response: str,
         thinking_content: str,
     ) -> (str, float, str):
         """Helper to track stats and return response"""
-        # Calculate total tokens used in this request
-        tokens_after = ui.get_conversation_token_count(conversation_history)
-        total_tokens_used = tokens_after - tokens_before
+        # Calculate total tokens used in this request, the messages it appended
+        total_tokens_used = ui.get_conversation_token_count(
+            conversation_history[history_length:]
+        )
 
         # Calculate thinking tokens (approximate: 4 chars per token)
         thinking_tokens = len(thinking_content) // 4 if thinking_content else 0
@@ -339,9 +504,9 @@ class Model:
         temperature: float = 0,
         enable_thinking: bool = True,
     ) -> (str, float):
-        start_time = time()
-        # Track tokens before request
-        tokens_before = ui.get_conversation_token_count(conversation_history)
+        start_time = monotonic()
+        # Track the history length before request
+        history_length = len(conversation_history)
 
         # Configuration: Maximum thinking tokens allowed (configurable per model size)
         MAX_THINKING_TOKENS = self._get_max_thinking_tokens()
@@ -356,38 +521,16 @@ class Model:
         )
 
         while True:
-            full_content = ""
-            thinking_content = ""
-            tool_calls = []
-
-            ui.show_thinking(full_content, live, start_time)
-
-            # Use num_predict to hard-limit total generation
-            for chunk in self.get_stream(
-                conversation_history,
-                temperature=temperature,
-                max_tokens=MAX_TOTAL_TOKENS,
-                enable_thinking=enable_thinking,
-            ):
-                message = chunk.get("message", {})
-
-                # Check for content
-                if content := message.get("content"):
-                    full_content += content
-                    ui.show_thinking(full_content, live, start_time, thinking_content)
-
-                # Check for thinking (independent of content)
-                if thinking := message.get("thinking"):
-                    thinking_content += thinking
-                    ui.show_thinking(full_content, live, start_time, thinking_content)
-
-                # Check for tool calls (independent of content/thinking)
-                if message.get("tool_calls"):
-                    tool_calls = message["tool_calls"]
-
-                # Update UI even if nothing new
-                if not content and not thinking and not message.get("tool_calls"):
-                    ui.show_thinking(full_content, live, start_time, thinking_content)
+            full_content, thinking_content, tool_calls = run_async(
+                self._stream_response(
+                    conversation_history,
+                    live,
+                    start_time,
+                    temperature=temperature,
+                    max_tokens=MAX_TOTAL_TOKENS,
+                    enable_thinking=enable_thinking,
+                )
+            )
 
             # Check if we got a response or just endless thinking
             current_thinking_tokens = len(thinking_content) // 4
@@ -402,11 +545,11 @@ class Model:
 
                 if thinking_loop_count >= MAX_THINKING_LOOPS:
                     # Force conclusion - model is stuck
-                    elapsed = time() - start_time
+                    elapsed = monotonic() - start_time
                     response = f"[⚠️ Model exceeded thinking limit ({current_thinking_tokens} tokens) - provide a direct answer next time]\n\nBased on the analysis, I need to provide a direct answer but got stuck in thinking.\n"
                     return self._track_and_return(
                         conversation_history,
-                        tokens_before,
+                        history_length,
                         elapsed,
                         response,
                         thinking_content,
@@ -442,11 +585,9 @@ class Model:
                         )
                         tool_calls = [parsed_tool]
                         # Remove the function call from content but keep explanation text
-                        import re
-
                         # Remove patterns like: web_search('query') or execute_command("cmd")
-                        cleaned_content = re.sub(
-                            r'\b\w+\s*\(\s*[\'"][^\'"]*[\'"]\s*\)', "", full_content
+                        cleaned_content = FUNCTION_CALL_CLEANUP_PATTERN.sub(
+                            "", full_content
                         ).strip()
                         full_content = cleaned_content if cleaned_content else ""
 
@@ -457,11 +598,11 @@ class Model:
             conversation_history.append(assistant_message)
 
             if not tool_calls:
-                elapsed = time() - start_time
+                elapsed = monotonic() - start_time
                 response = f"{full_content}\n"
                 return self._track_and_return(
                     conversation_history,
-                    tokens_before,
+                    history_length,
                     elapsed,
                     response,
                     thinking_content,
@@ -470,15 +611,92 @@ class Model:
             # Stop Live display before processing tool calls (some tools need user input)
             live.stop()
 
-            # Process tool calls
-            for tool_call in tool_calls:
-                tool_result = self.call_tool(tool_call)
-                conversation_history.append(self.tool_result_message(tool_result))
+            # Process tool calls. Single and interactive ones run right here, with
+            # no event loop running, as confirmation prompts start their own
+            for batch in self._batch_tool_calls(tool_calls):
+                if len(batch) == 1:
+                    tool_results = [self.call_tool(batch[0])]
+                else:
+                    tool_results = run_async(self.call_tools_concurrently(batch))
+                for tool_result in tool_results:
+                    conversation_history.append(self.tool_result_message(tool_result))
 
             # Restart Live display for next model response
             live.start()
             # Continue the loop to get the next response from the model
 
+    async def _stream_response(
+        self,
+        conversation_history: list,
+        live: Live,
+        start_time: float,
+        temperature: float,
+        max_tokens: int,
+        enable_thinking: bool,
+    ) -> tuple:
+        """
+        Stream one model response, showing its progress on the live display
+
+        Args:
+            conversation_history: Messages to send
+            live: Live display showing the thinking indicator
+            start_time: Start of the request, for the elapsed time
+            temperature: Sampling temperature
+            max_tokens: Maximum number of tokens to generate
+            enable_thinking: Whether to request the model's thinking
+
+        Returns:
+            Tuple of (content, thinking content, tool calls)
+        """
+        # Minimum delay between two updates of the live indicator's token counts
+        # (the display itself is refreshed by Live)
+        UI_REFRESH_INTERVAL = 0.1
+
+        # Streamed pieces are collected in lists and joined once at the end
+        content_parts = []
+        thinking_parts = []
+        tool_calls = []
+
+        indicator = ui.ThinkingIndicator(start_time, content_parts, thinking_parts)
+        live.update(indicator)
+        last_refresh = monotonic()
+        # Bound once, the loop below runs for every streamed chunk
+        append_content = content_parts.append
+        append_thinking = thinking_parts.append
+
+        # Use num_predict to hard-limit total generation
+        async for chunk in await self.get_stream(
+            conversation_history,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            enable_thinking=enable_thinking,
+        ):
+            # Chunks are ChatResponse objects, plain attribute access is much
+            # cheaper than their dict-like get()
+            message = chunk.message
+
+            # Check for content
+            if content := message.content:
+                append_content(content)
+
+            # Check for thinking (independent of content)
+            if thinking := message.thinking:
+                append_thinking(thinking)
+
+            # Check for tool calls (independent of content/thinking)
+            if message.tool_calls:
+                tool_calls = message.tool_calls
+
+            # Coalesce chunks: update the indicator at most every UI_REFRESH_INTERVAL
+            now = monotonic()
+            if now - last_refresh >= UI_REFRESH_INTERVAL:
+                indicator.update()
+                last_refresh = now
+
+        # Final update with everything received
+        indicator.update()
+        return "".join(content_parts), "".join(thinking_parts), tool_calls
+
     def get_assistant_message(self, full_content, tool_calls):
         assistant_message = {"role": "assistant", "content": full_content}
         if tool_calls:
@@ -488,17 +706,61 @@ class Model:
     def tool_result_message(self, tool_result):
         return {"role": "tool", "content": tool_result}
 
-    def call_tool(self, tool_call: dict):
-        tool_name = tool_call["function"]["name"]
-        tool_args = tool_call["function"]["arguments"]
-        ui.show_tool_usage(tool_name, tool_args)
-        # Execute the tool
-        tool_result = self.tool_executor.execute_tool(tool_name, tool_args)
-        # Add tool result to conversation
+    def _batch_tool_calls(self, tool_calls: list) -> list:
+        """
+        Group consecutive parallel-safe tool calls so they can run concurrently
+
+        Any other tool call gets its own batch and acts as a barrier, which keeps
+        the requested order for tools with side effects or user interaction.
+        """
+        batches = []
+        for tool_call in tool_calls:
+            parallel_safe = self.tool_executor.is_parallel_safe(
+                tool_call["function"]["name"]
+            )
+            if parallel_safe and batches and batches[-1][0]:
+                batches[-1][1].append(tool_call)
+            else:
+                batches.append((parallel_safe, [tool_call]))
+        return [batch for _, batch in batches]
+
+    async def call_tools_concurrently(self, tool_calls: list) -> list:
+        """
+        Run parallel-safe tool calls concurrently in worker threads
+
+        All calls are shown before they start and all results once they are
+        done, in call order.
+        """
+        for tool_call in tool_calls:
+            self._show_tool_call(tool_call)
+        tool_results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._execute_tool_call, tool_call)
+                for tool_call in tool_calls
+            )
+        )
+        for tool_result in tool_results:
+            ui.show_tool_result(tool_result)
+        return list(tool_results)
 
+    def call_tool(self, tool_call: dict):
+        self._show_tool_call(tool_call)
+        tool_result = self._execute_tool_call(tool_call)
         ui.show_tool_result(tool_result)
         return tool_result
 
+    def _show_tool_call(self, tool_call: dict) -> None:
+        """Show the tool a call is about to run, with its arguments"""
+        ui.show_tool_usage(
+            tool_call["function"]["name"], tool_call["function"]["arguments"]
+        )
+
+    def _execute_tool_call(self, tool_call: dict) -> str:
+        """Execute a tool call without displaying anything"""
+        return self.tool_executor.execute_tool(
+            tool_call["function"]["name"], tool_call["function"]["arguments"]
+        )
+
     def get_user_message(self, user_message: str) -> Dict[str, str]:
         return {"role": "user", "content": user_message}
 
@@ -506,6 +768,13 @@ class Model:
         # Get current date and time for temporal context
         now = datetime.now()
         current_date = now.strftime("%Y-%m-%d")
+
+        # The message only changes with the date or the system prompt, the same
+        # message is returned otherwise so its token count is reused
+        key = (current_date, self.system_prompt)
+        if self._system_message_key == key:
+            return self._system_message
+
         day_of_week = now.strftime("%A")
 
         # Inject temporal context into system prompt
@@ -518,22 +787,23 @@ CURRENT TEMPORAL CONTEXT:
 Use this temporal information to understand the current context when the user refers to time-sensitive concepts like "today", "yesterday", "this week", "this month", "recently", etc.
 """
 
-        return {
+        self._system_message = {
             "role": "system",
             "content": temporal_context + "\n" + self.system_prompt,
         }
+        self._system_message_key = key
+        return self._system_message
 
 
 class VisionModel(Model):
     def get_user_message(self, user_message: str) -> Dict[str, str]:
         message = {"role": "user", "content": user_message}
-        images_path = extract_and_validate_images(user_message)
-        if images_path:
-            message["images"] = images_path
-            ui.show_image_found(images_path, user_message)
+        image_paths, images = extract_and_validate_images(user_message)
+        if images:
+            message["images"] = images
+            ui.show_image_found(image_paths, user_message)
             # Remove image paths from content
-            for image_path in images_path:
-                message["content"] = message["content"].replace(image_path, "")
+            message["content"] = remove_image_paths(user_message, image_paths)
         return message
 
 
@@ -544,15 +814,12 @@ class ModelFactory:
     def _load_config(name: str) -> dict | None:
         """Load model configuration from YAML file and merge with common prompts"""
         # Use XDG-compliant path resolution
-        from .utils.paths import get_models_config_path
-
         config_path = str(get_models_config_path())
 
         # Only try this one path (it already handles the hierarchy)
         for config_path in [config_path]:
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                config = load_yaml_cached(config_path)
 
                 models = config.get("models", {})
                 if name in models:
@@ -612,10 +879,12 @@ class ModelFactory:
         return None
 
     @staticmethod
-    def _get_model_info_from_ollama(model_name: str, ollama_client: object) -> dict:
+    def _get_model_info_from_ollama(
+        model_name: str, ollama_client: object, host: str | None = None
+    ) -> dict:
         """Get model information from Ollama"""
         try:
-            model_info = ollama_client.show(model_name)
+            model_info = get_model_details(ollama_client, host, model_name)
 
             # Extract context length
             context_length = 2048  # default
@@ -648,6 +917,8 @@ class ModelFactory:
         model_name: str,
         ollama_client: object,
         tool_executor: ToolExecutor | None = None,
+        async_ollama_client: ollama.AsyncClient | None = None,
+        host: str | None = None,
     ) -> Model | None:
         """
         Create a model instance based on the model name
@@ -656,6 +927,8 @@ class ModelFactory:
             model_name: Name of the model (e.g., "qwen3:4b")
             ollama_client: Ollama client instance
             tool_executor: Optional tool executor for models that support tools
+            async_ollama_client: Optional async Ollama client used for streaming
+            host: Ollama host URL the clients were created with
 
         Returns:
             Model instance or None if failed
@@ -665,7 +938,7 @@ class ModelFactory:
 
         # Get model info from Ollama (context, vision, tools support)
         ollama_info = ModelFactory._get_model_info_from_ollama(
-            model_name, ollama_client
+            model_name, ollama_client, host
         )
 
         # Use default values if config not found
@@ -688,6 +961,8 @@ class ModelFactory:
             system_prompt=system_prompt,
             ollama_client=ollama_client,
             max_token_context=ollama_info["max_token_context"],
+            async_ollama_client=async_ollama_client,
+            host=host,
         )
 
     @staticmethod
@@ -695,22 +970,11 @@ class ModelFactory:
         """Get list of available model names from config"""
 
         # Use XDG-compliant path resolution
-        from .utils.paths import get_models_config_path
-
-        config_path = str(get_models_config_path())
-
-        # Only try this one path (it already handles the hierarchy)
-        for config_path in [config_path]:
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-                return list(config.get("models", {}).keys())
-            except FileNotFoundError:
-                continue  # Try next path
-            except:
-                continue
-
-        return []
+        try:
+            config = load_yaml_cached(str(get_models_config_path()))
+            return list(config.get("models", {}).keys())
+        except Exception:
+            return []
 
     @staticmethod
     def is_model_ready(name: str) -> bool:
@@ -8,8 +8,12 @@ from rich.text import Text
 from prompt_toolkit import PromptSession
 from prompt_toolkit.formatted_text import HTML
 
+from . import ui
 from .tools_impl import ToolRegistry
 
+# Confirmation prompt, parsed once
+CONFIRMATION_PROMPT = HTML('<ansi color="#9CA3AF">    Allow? (Y/n): </ansi>')
+
 
 class ToolExecutor:
     """Execute tools requested by the LLM"""
@@ -27,6 +31,9 @@ class ToolExecutor:
             get_confirmation_callback=self._get_confirmation,
         )
         self.tools_definition = self.tool_registry.get_tools_definition()
+        self.console: Console = ui.get_console()
+        # Created on first confirmation, reused afterwards
+        self._confirmation_session: PromptSession | None = None
 
     def _get_confirmation(self, emoji: str, action: str, details: List[tuple]) -> bool:
         """
@@ -40,7 +47,7 @@ class ToolExecutor:
         Returns:
             True if user confirms, False otherwise
         """
-        console = Console()
+        console = self.console
         console.print()
 
         # Show action header
@@ -56,9 +63,10 @@ class ToolExecutor:
             detail_text.append(value, style="#9CA3AF")
             console.print(detail_text)
 
-        session = PromptSession()
+        if self._confirmation_session is None:
+            self._confirmation_session = PromptSession()
         confirmation = (
-            session.prompt(HTML('<ansi color="#9CA3AF">    Allow? (Y/n): </ansi>'))
+            self._confirmation_session.prompt(CONFIRMATION_PROMPT)
             .strip()
             .lower()
         )
@@ -77,3 +85,15 @@ class ToolExecutor:
             String result of the tool execution
         """
         return self.tool_registry.execute_tool(tool_name, arguments)
+
+    def is_parallel_safe(self, tool_name: str) -> bool:
+        """
+        Check whether a tool can run concurrently with other tools
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            True if the tool has no side effects and needs no user interaction
+        """
+        return self.tool_registry.is_parallel_safe(tool_name)
@@ -2,7 +2,6 @@
 Ask User Tool - Ask the user a question
 """
 
-from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from prompt_toolkit import PromptSession
@@ -10,6 +9,7 @@ from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import InMemoryHistory
 
 from .base import Tool
+from .. import ui
 
 
 class AskUserTool(Tool):
@@ -37,7 +37,7 @@ class AskUserTool(Tool):
 
     def execute(self, question: str, context: str = None) -> str:
         """Ask the user a question and return their response"""
-        console = Console()
+        console = ui.get_console()
         console.print()
 
         # Show the question in a nice panel
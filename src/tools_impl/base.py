@@ -9,6 +9,9 @@ from typing import Any, Dict
 class Tool(ABC):
     """Base class for all tools"""
 
+    # Tools without side effects or user interaction can run concurrently
+    parallel_safe: bool = False
+
     def __init__(self, name: str, description: str, parameters: Dict[str, Any]):
         """
         Initialize a tool
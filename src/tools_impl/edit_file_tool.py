@@ -3,7 +3,6 @@ Edit File Tool - Edit a file by replacing specific content
 """
 
 import difflib
-from rich.console import Console
 from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.text import Text
@@ -11,6 +10,7 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.formatted_text import HTML
 
 from .base import Tool
+from .. import ui
 
 
 class EditFileTool(Tool):
@@ -77,7 +77,7 @@ class EditFileTool(Tool):
             diff_output = self._generate_diff(content, new_file_content, file_path)
 
             if self.require_confirmation:
-                console = Console()
+                console = ui.get_console()
                 console.print()
 
                 # Show action header
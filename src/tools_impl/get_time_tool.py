@@ -9,6 +9,8 @@ from .base import Tool
 class GetCurrentTimeTool(Tool):
     """Tool to get current date and time information"""
 
+    parallel_safe = True
+
     def __init__(self):
         super().__init__(
             name="get_current_time",
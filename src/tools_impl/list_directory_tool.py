@@ -2,7 +2,6 @@
 List Directory Tool - List contents of a directory
 """
 
-import os
 from pathlib import Path
 from .base import Tool
 
@@ -10,6 +9,8 @@ from .base import Tool
 class ListDirectoryTool(Tool):
     """List directory contents with detailed information"""
 
+    parallel_safe = True
+
     def __init__(self):
         super().__init__(
             name="list_directory",
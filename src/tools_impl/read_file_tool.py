@@ -8,6 +8,8 @@ from .base import Tool
 class ReadFileTool(Tool):
     """Read the contents of a file"""
 
+    parallel_safe = True
+
     def __init__(self):
         super().__init__(
             name="read_file",
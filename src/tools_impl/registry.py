@@ -60,9 +60,12 @@ class ToolRegistry:
         Get tool definitions for LLM function calling
 
         Returns:
-            List of tool definitions in OpenAI function calling format
+            List of tool definitions in OpenAI function calling format, sorted by
+            name so that the request prefix sent to the model is stable
         """
-        return [tool.get_definition() for tool in self.tools.values()]
+        return [
+            self.tools[name].get_definition() for name in sorted(self.tools.keys())
+        ]
 
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """
@@ -87,6 +90,11 @@ class ToolRegistry:
         # except Exception as e:
         #     return f"Error executing {tool_name}: {str(e)}"
 
+    def is_parallel_safe(self, tool_name: str) -> bool:
+        """Check whether a tool can run concurrently with other tools"""
+        tool = self.tools.get(tool_name)
+        return tool is not None and tool.parallel_safe
+
     def get_tool(self, name: str) -> Tool | None:
         """Get a tool by name"""
         return self.tools.get(name)
@@ -35,6 +35,8 @@ from .base import Tool
 class WebSearchTool(Tool):
     """Search the internet for information using DuckDuckGo"""
 
+    parallel_safe = True
+
     def __init__(self):
         super().__init__(
             name="web_search",
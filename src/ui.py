@@ -5,13 +5,15 @@ UI and display utilities for Claudette
 import time
 import json
 import re
-import math
-import random
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from colorama import Fore, Style
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich.console import Console, Group
-from rich.markdown import Markdown
+from rich.markdown import CodeBlock, Markdown
+from rich.syntax import Syntax
 from rich.live import Live
 from rich.text import Text
 from rich.panel import Panel
@@ -20,11 +22,16 @@ from rich import box
 from rich.align import Align
 import tiktoken
 
+try:
+    import orjson  # Fast JSON serializer (optional)
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
-    from .models import Model, ModelFactory
+    from .models import Model, ModelFactory, get_model_details
 else:
     # Import for runtime use
-    from .models import ModelFactory
+    from .models import ModelFactory, get_model_details
 
 # Professional color scheme
 BRAND_COLOR = "#7C3AED"  # Purple
@@ -34,9 +41,143 @@ TEXT_SECONDARY = "#9CA3AF"  # Medium gray
 SUCCESS_COLOR = "#10B981"  # Green
 WARNING_COLOR = "#F59E0B"  # Amber
 
+# Extensive list of thinking/processing words
+THINKING_WORDS = [
+    # Cognitive processes
+    "pondering",
+    "reasoning",
+    "analyzing",
+    "processing",
+    "contemplating",
+    "considering",
+    "evaluating",
+    "reflecting",
+    "computing",
+    "synthesizing",
+    "deliberating",
+    "examining",
+    "inferring",
+    "deducing",
+    "interpreting",
+    "assessing",
+    "theorizing",
+    "hypothesizing",
+    "conceptualizing",
+    "formulating",
+    # Mental activities
+    "cogitating",
+    "ruminating",
+    "meditating",
+    "musing",
+    "speculating",
+    "surmising",
+    "calculating",
+    "reckoning",
+    "discerning",
+    "perceiving",
+    "comprehending",
+    "understanding",
+    "grasping",
+    "apprehending",
+    "fathoming",
+    "deciphering",
+    # Analytical processes
+    "dissecting",
+    "parsing",
+    "scrutinizing",
+    "investigating",
+    "exploring",
+    "probing",
+    "studying",
+    "researching",
+    "surveying",
+    "reviewing",
+    "inspecting",
+    "auditing",
+    "diagnosing",
+    "troubleshooting",
+    "debugging",
+    "profiling",
+    # Creative processes
+    "ideating",
+    "brainstorming",
+    "innovating",
+    "devising",
+    "crafting",
+    "designing",
+    "architecting",
+    "constructing",
+    "composing",
+    "authoring",
+    "drafting",
+    "sketching",
+    "prototyping",
+    "modeling",
+    "simulating",
+    "envisioning",
+    # Decision-making
+    "weighing",
+    "judging",
+    "determining",
+    "resolving",
+    "deciding",
+    "choosing",
+    "selecting",
+    "prioritizing",
+    "optimizing",
+    "refining",
+    "tuning",
+    "calibrating",
+    "balancing",
+    "harmonizing",
+    "reconciling",
+    "integrating",
+    # Data processing
+    "aggregating",
+    "collating",
+    "indexing",
+    "cataloging",
+    "organizing",
+    "structuring",
+    "formatting",
+    "transforming",
+    "mapping",
+    "filtering",
+    "sorting",
+    "ranking",
+    "clustering",
+    "classifying",
+    "categorizing",
+    "tagging",
+    # Learning & adaptation
+    "learning",
+    "adapting",
+    "evolving",
+    "developing",
+    "growing",
+    "improving",
+    "enhancing",
+    "advancing",
+    "progressing",
+    "maturing",
+    "refining",
+    "perfecting",
+]
+
 # Initialize tokenizer (using cl100k_base encoding which is used by GPT-4 and similar models)
 _tokenizer = None
 
+# Console shared by the display functions, created on first use
+_console = None
+
+
+def get_console() -> Console:
+    """Get the console shared by the display functions"""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 def get_token_count(text: str) -> int:
     """Count the number of tokens in a text string"""
@@ -54,6 +195,27 @@ def get_token_count(text: str) -> int:
         return len(text) // 4
 
 
+@lru_cache(maxsize=8)
+def get_cached_token_count(text: str) -> int:
+    """
+    Count the number of tokens in a text counted again and again
+
+    Meant for long texts that are displayed repeatedly, like system prompts;
+    streamed or one-off texts should use get_token_count.
+    """
+    return get_token_count(text)
+
+
+def to_json(obj, indent: bool = False, default=None) -> str:
+    """Serialize an object to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=default
+    )
+
+
 def serialize_message_for_tokens(message: dict) -> str:
     """Serialize a message to a string representation for token counting"""
 
@@ -69,7 +231,7 @@ def serialize_message_for_tokens(message: dict) -> str:
         return str(obj)
 
     try:
-        return json.dumps(message, default=default_serializer)
+        return to_json(message, default=default_serializer)
     except Exception:
         return str(message)
 
@@ -88,7 +250,7 @@ def get_conversation_token_count(conversation_history: list) -> int:
 
 def show_welcome(model: "Model", host: str, ollama_models_available: list):
     """Display welcome message with configuration"""
-    console = Console()
+    console = get_console()
 
     # Mascot and header - minimalist block design
     console.print()
@@ -229,7 +391,9 @@ def show_welcome(model: "Model", host: str, ollama_models_available: list):
 
                         # Get capabilities from Ollama
                         try:
-                            model_data = model.ollama_client.show(model_name)
+                            model_data = get_model_details(
+                                model.ollama_client, model.host, model_name
+                            )
                             capabilities = model_data.get("capabilities", [])
 
                             # Check for vision
@@ -405,148 +569,22 @@ def show_welcome(model: "Model", host: str, ollama_models_available: list):
     console.print()
 
 
-def show_thinking(
-    full_content: str, live: Live, start_time: float, thinking_content: str = ""
+def render_thinking(
+    start_time: float,
+    content_tokens: int = 0,
+    thinking_tokens: int = 0,
+    thinking_preview: str = "",
 ):
-    """Display thinking indicator while processing"""
-    elapsed = time.time() - start_time
-
-    # Extensive list of thinking/processing words
-    thinking_words = [
-        # Cognitive processes
-        "pondering",
-        "reasoning",
-        "analyzing",
-        "processing",
-        "contemplating",
-        "considering",
-        "evaluating",
-        "reflecting",
-        "computing",
-        "synthesizing",
-        "deliberating",
-        "examining",
-        "inferring",
-        "deducing",
-        "interpreting",
-        "assessing",
-        "theorizing",
-        "hypothesizing",
-        "conceptualizing",
-        "formulating",
-        # Mental activities
-        "cogitating",
-        "ruminating",
-        "meditating",
-        "musing",
-        "speculating",
-        "surmising",
-        "calculating",
-        "reckoning",
-        "discerning",
-        "perceiving",
-        "comprehending",
-        "understanding",
-        "grasping",
-        "apprehending",
-        "fathoming",
-        "deciphering",
-        # Analytical processes
-        "dissecting",
-        "parsing",
-        "scrutinizing",
-        "investigating",
-        "exploring",
-        "probing",
-        "studying",
-        "researching",
-        "surveying",
-        "reviewing",
-        "inspecting",
-        "auditing",
-        "diagnosing",
-        "troubleshooting",
-        "debugging",
-        "profiling",
-        # Creative processes
-        "ideating",
-        "brainstorming",
-        "innovating",
-        "devising",
-        "crafting",
-        "designing",
-        "architecting",
-        "constructing",
-        "composing",
-        "authoring",
-        "drafting",
-        "sketching",
-        "prototyping",
-        "modeling",
-        "simulating",
-        "envisioning",
-        # Decision-making
-        "weighing",
-        "judging",
-        "determining",
-        "resolving",
-        "deciding",
-        "choosing",
-        "selecting",
-        "prioritizing",
-        "optimizing",
-        "refining",
-        "tuning",
-        "calibrating",
-        "balancing",
-        "harmonizing",
-        "reconciling",
-        "integrating",
-        # Data processing
-        "aggregating",
-        "collating",
-        "indexing",
-        "cataloging",
-        "organizing",
-        "structuring",
-        "formatting",
-        "transforming",
-        "mapping",
-        "filtering",
-        "sorting",
-        "ranking",
-        "clustering",
-        "classifying",
-        "categorizing",
-        "tagging",
-        # Learning & adaptation
-        "learning",
-        "adapting",
-        "evolving",
-        "developing",
-        "growing",
-        "improving",
-        "enhancing",
-        "advancing",
-        "progressing",
-        "maturing",
-        "refining",
-        "perfecting",
-    ]
+    """Build the thinking indicator renderable"""
+    elapsed = time.monotonic() - start_time
 
     # Pick a random word based on elapsed time to have some variation
-    word_index: int = int(start_time) % len(thinking_words)
-    thinking_word = thinking_words[word_index].capitalize()
+    word_index: int = int(start_time) % len(THINKING_WORDS)
+    thinking_word = THINKING_WORDS[word_index].capitalize()
 
     # Animated thinking indicator with pulsing dot
     dots = "." * (int(elapsed * 2) % 4)
 
-    # Calculate pulsing effect for the dot
-    # Pulse speed: ~2 pulses per second
-    pulse_phase = (elapsed * 2) % 1.0  # 0.0 to 1.0
-    # Create smooth sine wave for size: 0.5 -> 1.0 -> 0.5
-    pulse_intensity = 0.5 + 0.5 * abs(math.sin(pulse_phase * math.pi))
-
     # Choose dot character based on pulse phase
     # Cycle through different sizes for visual pulse effect
     pulse_cycle = int((elapsed * 4) % 3)
@@ -564,36 +602,119 @@ def show_thinking(
     thinking_text.append(dots.ljust(3), style=f"dim {TEXT_SECONDARY}")
     thinking_text.append(f" {elapsed:.1f}s", style=f"dim {TEXT_SECONDARY}")
 
-    if len(full_content) > 0:
-        token_count = get_token_count(full_content)
-        thinking_text.append(f" · {token_count} tokens", style=f"dim {TEXT_SECONDARY}")
-
-    # Display thinking content if present
-    if thinking_content:
-        thinking_token_count = get_token_count(thinking_content)
+    if content_tokens > 0:
         thinking_text.append(
-            f" · 🧠 {thinking_token_count} thinking tokens",
-            style=f"bold {WARNING_COLOR}",
+            f" · {content_tokens} tokens", style=f"dim {TEXT_SECONDARY}"
         )
 
-        # Create a group with header and thinking content preview
-        thinking_preview = (
-            thinking_content[-200:] if len(thinking_content) > 200 else thinking_content
-        )
-        thinking_display = Group(
-            thinking_text,
-            Text(""),
-            Panel(
-                Text(thinking_preview, style=f"italic {TEXT_SECONDARY}"),
-                title="[bold]💭 Thinking[/bold]",
-                border_style=f"{WARNING_COLOR}",
-                box=box.ROUNDED,
-                padding=(0, 1),
-            ),
-        )
-        live.update(thinking_display)
-    else:
-        live.update(thinking_text)
+    # Display thinking content if present
+    if not thinking_preview:
+        return thinking_text
+
+    thinking_text.append(
+        f" · 🧠 {thinking_tokens} thinking tokens",
+        style=f"bold {WARNING_COLOR}",
+    )
+
+    # Create a group with header and thinking content preview
+    return Group(
+        thinking_text,
+        Text(""),
+        Panel(
+            Text(thinking_preview, style=f"italic {TEXT_SECONDARY}"),
+            title="[bold]💭 Thinking[/bold]",
+            border_style=f"{WARNING_COLOR}",
+            box=box.ROUNDED,
+            padding=(0, 1),
+        ),
+    )
+
+
+class ThinkingIndicator:
+    """
+    Live renderable tracking a streamed response
+
+    The stream loop appends to the given part lists and calls `update()` from
+    time to time; the display itself is built when Live refreshes, so the
+    elapsed time keeps moving while waiting for the first chunk.
+    """
+
+    def __init__(
+        self, start_time: float, content_parts: list, thinking_parts: list
+    ) -> None:
+        self.start_time = start_time
+        self.content_parts = content_parts
+        self.thinking_parts = thinking_parts
+        self.content_tokens = 0
+        self.thinking_tokens = 0
+        self.thinking_preview = ""
+        self._counted_content = 0
+        self._counted_thinking = 0
+        self._start_ns = int(start_time * 1_000_000_000)
+        self._rendered_key = None
+        self._rendered = None
+
+    def update(self) -> None:
+        """Count the tokens of the parts received since the last update"""
+        if len(self.content_parts) > self._counted_content:
+            self.content_tokens += get_token_count(
+                "".join(self.content_parts[self._counted_content :])
+            )
+            self._counted_content = len(self.content_parts)
+
+        if len(self.thinking_parts) > self._counted_thinking:
+            self.thinking_tokens += get_token_count(
+                "".join(self.thinking_parts[self._counted_thinking :])
+            )
+            self._counted_thinking = len(self.thinking_parts)
+
+            # Preview the last 200 characters without joining the whole text
+            tail, size = [], 0
+            for piece in reversed(self.thinking_parts):
+                tail.append(piece)
+                size += len(piece)
+                if size >= 200:
+                    break
+            self.thinking_preview = "".join(reversed(tail))[-200:]
+
+    def __rich__(self):
+        # The indicator only changes visibly every tenth of a second or when
+        # new parts were counted, so reuse the last renderable in between
+        tenths = (time.monotonic_ns() - self._start_ns) // 100_000_000
+        key = (tenths, self._counted_content, self._counted_thinking)
+        if key != self._rendered_key:
+            self._rendered = render_thinking(
+                self.start_time,
+                self.content_tokens,
+                self.thinking_tokens,
+                self.thinking_preview,
+            )
+            self._rendered_key = key
+        return self._rendered
+
+
+@lru_cache(maxsize=32)
+def _get_lexer(language: str):
+    """Get a Pygments lexer by language name, cached across renders"""
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return None
+
+
+class _CodeBlock(CodeBlock):
+    """Markdown code block reusing cached lexers instead of looking them up per render"""
+
+    def __rich_console__(self, console, options):
+        code = str(self.text).rstrip()
+        lexer = _get_lexer(self.lexer_name) or self.lexer_name
+        yield Syntax(code, lexer, theme=self.theme, word_wrap=True, padding=1)
+
+
+class _Markdown(Markdown):
+    """Markdown renderable using cached lexers for fenced code blocks"""
+
+    elements = {**Markdown.elements, "fence": _CodeBlock, "code_block": _CodeBlock}
 
 
 def render_math_content(content: str) -> str:
@@ -601,6 +722,9 @@ def render_math_content(content: str) -> str:
     Enhance mathematical expressions for terminal display.
     Converts LaTeX math expressions to a more readable format.
     """
+    if "$" not in content:
+        return content
+
     # Pattern for inline math $...$
     inline_pattern = r"\$([^\$]+)\$"
     # Pattern for display math $$...$$
@@ -657,7 +781,7 @@ def show_response(
         enhanced_thinking = render_math_content(thinking_content)
         console.print(
             Panel(
-                Markdown(enhanced_thinking, code_theme="monokai"),
+                _Markdown(enhanced_thinking, code_theme="monokai"),
                 title="[bold]💭 Thinking Process[/bold]",
                 border_style=f"{WARNING_COLOR}",
                 box=box.ROUNDED,
@@ -670,15 +794,50 @@ def show_response(
     enhanced_content = render_math_content(content)
 
     # Markdown content with minimal styling
-    console.print(Markdown(enhanced_content, code_theme="monokai"))
+    console.print(_Markdown(enhanced_content, code_theme="monokai"))
     console.print()
     console.print(f"{'─' * console.width}", style=f"dim {TEXT_SECONDARY}")
     console.print()
 
 
+def _preview(text: str, limit: int) -> str:
+    """Truncate text to `limit` characters, appending "..." when it is cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _shorten_strings(value, limit: int = 400, max_items: int = 50):
+    """
+    Recursively truncate a JSON-like value before serializing it for display
+
+    Strings longer than `limit` characters are cut, and lists and dicts keep at
+    most `max_items` entries.
+    """
+    if isinstance(value, str):
+        length = len(value)
+        if length > limit:
+            return value[:limit] + f"...<{length - limit} more>"
+        return value
+    if isinstance(value, dict):
+        shortened = {
+            key: _shorten_strings(item, limit, max_items)
+            for key, item in islice(value.items(), max_items)
+        }
+        if len(value) > max_items:
+            shortened["..."] = f"<{len(value) - max_items} more keys>"
+        return shortened
+    if isinstance(value, (list, tuple)):
+        shortened = [
+            _shorten_strings(item, limit, max_items) for item in value[:max_items]
+        ]
+        if len(value) > max_items:
+            shortened.append(f"...<{len(value) - max_items} more items>")
+        return shortened
+    return value
+
+
 def show_tool_usage(tool_name: str, tool_args: dict):
     """Display tool usage information"""
-    console = Console()
+    console = get_console()
 
     # Tool header
     tool_text = Text()
@@ -696,10 +855,7 @@ def show_tool_usage(tool_name: str, tool_args: dict):
             # Format the argument value based on its type
             if isinstance(arg_value, str):
                 # Truncate long strings for readability
-                if len(arg_value) > 100:
-                    display_value = arg_value[:100] + "..."
-                else:
-                    display_value = arg_value
+                display_value = _preview(arg_value, 100)
                 # Replace newlines with visible indicator
                 display_value = display_value.replace(
                     "\n", "↵\n    " + " " * (len(arg_name) + 2)
@@ -709,9 +865,9 @@ def show_tool_usage(tool_name: str, tool_args: dict):
                 arg_text.append(str(arg_value), style=f"{WARNING_COLOR}")
             elif isinstance(arg_value, (list, dict)):
                 # Pretty print JSON for complex types
-                json_str = json.dumps(arg_value, indent=2, ensure_ascii=False)
-                if len(json_str) > 100:
-                    json_str = json_str[:100] + "..."
+                json_str = _preview(
+                    to_json(_shorten_strings(arg_value, 100, 20), indent=True), 100
+                )
                 arg_text.append(json_str, style=f"{WARNING_COLOR}")
             else:
                 arg_text.append(str(arg_value), style=f"{WARNING_COLOR}")
@@ -723,10 +879,10 @@ def show_tool_usage(tool_name: str, tool_args: dict):
 
 def show_tool_result(result: str):
     """Display tool execution result with partial output preview"""
-    console = Console()
+    console = get_console()
 
     # Check if result contains an error
-    is_error = result.startswith("Error:") or "error" in result.lower()[:100]
+    is_error = result.startswith("Error:") or "error" in result[:100].lower()
 
     # Show success or error indicator
     result_text = Text()
@@ -753,14 +909,9 @@ def show_tool_result(result: str):
             )
         console.print(output_header)
 
-        # Prepare output preview
-        result_lines = result.split("\n")
-        preview_lines = result_lines[:MAX_LINES]
-        preview_text = "\n".join(preview_lines)
-
-        # Truncate if too long
-        if len(preview_text) > MAX_PREVIEW_LENGTH:
-            preview_text = preview_text[:MAX_PREVIEW_LENGTH] + "..."
+        # Prepare output preview (only the first lines are split out)
+        preview_lines = result.split("\n", MAX_LINES)[:MAX_LINES]
+        preview_text = _preview("\n".join(preview_lines), MAX_PREVIEW_LENGTH)
 
         # Display preview in a subtle panel
         preview_panel = Panel(
@@ -773,7 +924,7 @@ def show_tool_result(result: str):
         console.print(preview_panel)
 
         # Show statistics
-        total_lines = len(result_lines)
+        total_lines = result.count("\n") + 1
         total_chars = len(result)
         stats_text = Text()
         stats_text.append("    ", style="")
@@ -831,7 +982,7 @@ def show_tool_result(result: str):
 
 def show_history(conversation_history: list):
     """Display conversation history"""
-    console = Console()
+    console = get_console()
     console.print()
 
     for idx, msg in enumerate(conversation_history, 1):
@@ -851,7 +1002,7 @@ def show_history(conversation_history: list):
 
             # Render markdown for user messages
             if content:
-                console.print(Markdown(str(content)))
+                console.print(_Markdown(str(content)))
 
         elif role == "assistant":
             prefix = Text()
@@ -861,7 +1012,7 @@ def show_history(conversation_history: list):
 
             # Render markdown for assistant messages
             if content:
-                console.print(Markdown(str(content)))
+                console.print(_Markdown(str(content)))
 
             # Show tool calls if present
             if tool_calls:
@@ -879,7 +1030,7 @@ def show_history(conversation_history: list):
 
                     tool_info.append(f"{tool_name}", style=f"bold {TEXT_PRIMARY}")
                     tool_info.append(
-                        f" {json.dumps(tool_args, ensure_ascii=False)}",
+                        f" {to_json(_shorten_strings(tool_args))}",
                         style=f"dim {TEXT_SECONDARY}",
                     )
                     console.print(tool_info)
@@ -892,9 +1043,7 @@ def show_history(conversation_history: list):
 
             # Truncate long tool results
             if content:
-                truncated = str(content)[:200]
-                if len(str(content)) > 200:
-                    truncated += "..."
+                truncated = _preview(str(content), 200)
                 console.print(f"    {truncated}", style=f"dim {TEXT_SECONDARY}")
 
         console.print()
@@ -905,7 +1054,7 @@ def show_history(conversation_history: list):
 
 def show_error(error_msg: str):
     """Display error message"""
-    console = Console()
+    console = get_console()
     error_text = Text()
     error_text.append("  ✗ ", style="bold red")
     error_text.append("Error: ", style="bold red")
@@ -918,7 +1067,7 @@ def show_error(error_msg: str):
 
 def show_clear_confirmation():
     """Display confirmation that history was cleared"""
-    console = Console()
+    console = get_console()
     clear_text = Text()
     clear_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     clear_text.append("History cleared", style=f"{TEXT_SECONDARY}")
@@ -930,7 +1079,7 @@ def show_clear_confirmation():
 
 def show_save_confirmation(filename: str):
     """Display confirmation that conversation was saved"""
-    console = Console()
+    console = get_console()
     save_text = Text()
     save_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     save_text.append("Conversation saved to ", style=f"{TEXT_SECONDARY}")
@@ -943,7 +1092,7 @@ def show_save_confirmation(filename: str):
 
 def show_load_confirmation(filename: str, message_count: int):
     """Display confirmation that conversation was loaded"""
-    console = Console()
+    console = get_console()
     load_text = Text()
     load_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     load_text.append("Conversation loaded from ", style=f"{TEXT_SECONDARY}")
@@ -957,7 +1106,7 @@ def show_load_confirmation(filename: str, message_count: int):
 
 def show_goodbye():
     """Display goodbye message"""
-    console = Console()
+    console = get_console()
     console.print()
     goodbye = Text("Goodbye", style=f"dim {TEXT_SECONDARY}")
     console.print(Align.center(goodbye))
@@ -966,7 +1115,7 @@ def show_goodbye():
 
 def show_image_found(image_paths: list, prompt: str):
     """Display information about found images"""
-    console = Console()
+    console = get_console()
 
     image_text = Text()
     image_text.append("  ▸ ", style=f"{WARNING_COLOR}")
@@ -980,7 +1129,7 @@ def show_image_found(image_paths: list, prompt: str):
 
 def show_model_unload_start():
     """Display model unloading start message"""
-    console = Console()
+    console = get_console()
     console.print(
         Text("  ⏳ Unloading current model...", style=f"dim {TEXT_SECONDARY}")
     )
@@ -988,7 +1137,7 @@ def show_model_unload_start():
 
 def show_model_switch_success(model_name: str):
     """Display model switch success message"""
-    console = Console()
+    console = get_console()
     success_text = Text()
     success_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     success_text.append(f"Switched to model: {model_name}", style=f"{TEXT_SECONDARY}")
@@ -999,7 +1148,7 @@ def show_model_switch_success(model_name: str):
 
 def show_model_unload_success():
     """Display model unload success message"""
-    console = Console()
+    console = get_console()
     unload_text = Text()
     unload_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     unload_text.append("Model unloaded from memory", style=f"{TEXT_SECONDARY}")
@@ -1010,7 +1159,7 @@ def show_model_unload_success():
 
 def show_pull_start(model_name: str):
     """Display pull start message"""
-    console = Console()
+    console = get_console()
     pull_text = Text()
     pull_text.append("  ⏳ ", style=f"{WARNING_COLOR}")
     pull_text.append(f"Pulling model: {model_name}", style=f"{TEXT_SECONDARY}")
@@ -1021,7 +1170,7 @@ def show_pull_start(model_name: str):
 
 def show_pull_success(model_name: str):
     """Display pull success message"""
-    console = Console()
+    console = get_console()
     success_text = Text()
     success_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
     success_text.append(
@@ -1034,7 +1183,7 @@ def show_pull_success(model_name: str):
 
 def show_model_info(model_name: str, model_info: dict):
     """Display model information in a formatted panel"""
-    console = Console()
+    console = get_console()
 
     try:
         console.print()
@@ -1140,7 +1289,7 @@ def show_model_info(model_name: str, model_info: dict):
 
 def show_temperature_change(temperature: float):
     """Display temperature change confirmation"""
-    console = Console()
+    console = get_console()
     console.print()
     console.print(
         f"  [dim {TEXT_SECONDARY}]→[/dim {TEXT_SECONDARY}] Temperature set to [bold {ACCENT_COLOR}]{temperature}[/bold {ACCENT_COLOR}]"
@@ -1150,7 +1299,7 @@ def show_temperature_change(temperature: float):
 
 def show_validation_change(validation_enabled: bool):
     """Display validation status change confirmation"""
-    console = Console()
+    console = get_console()
     validation_text = Text()
     validation_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
 
@@ -1170,7 +1319,7 @@ def show_validation_change(validation_enabled: bool):
 
 def show_thinking_change(thinking_enabled: bool):
     """Display thinking mode status change confirmation"""
-    console = Console()
+    console = get_console()
     thinking_text = Text()
     thinking_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
 
@@ -1190,7 +1339,7 @@ def show_thinking_change(thinking_enabled: bool):
 
 def show_models_list(models_response: dict):
     """Display list of available models"""
-    console = Console()
+    console = get_console()
 
     console.print()
 
@@ -1248,7 +1397,7 @@ def show_models_list(models_response: dict):
 
 def show_conversations_list(conversation_files: list):
     """Display list of saved conversations"""
-    console = Console()
+    console = get_console()
 
     console.print()
 
@@ -1329,7 +1478,7 @@ def show_conversations_list(conversation_files: list):
 
 def show_info(message: str):
     """Display an info message"""
-    console = Console()
+    console = get_console()
     console.print()
 
     info_text = Text()
@@ -1342,7 +1491,7 @@ def show_info(message: str):
 
 def show_success(message: str):
     """Display a success message"""
-    console = Console()
+    console = get_console()
     console.print()
 
     success_text = Text()
@@ -1355,7 +1504,7 @@ def show_success(message: str):
 
 def show_warning(message: str):
     """Display a warning message"""
-    console = Console()
+    console = get_console()
     console.print()
 
     warning_text = Text()
@@ -1368,7 +1517,7 @@ def show_warning(message: str):
 
 def show_reprompting_change(reprompting_enabled: bool):
     """Display reprompting mode status change confirmation"""
-    console = Console()
+    console = get_console()
     reprompting_text = Text()
     reprompting_text.append("  ✓ ", style=f"{SUCCESS_COLOR}")
 
@@ -1396,9 +1545,11 @@ def show_reprompting_change(reprompting_enabled: bool):
     console.print()
 
 
-def show_reprompting_animation(content: str, live: Live, start_time: float):
+def show_reprompting_animation(
+    content: str, live: Live, start_time: float, token_count: Optional[int] = None
+):
     """Display reprompting animation with token counter"""
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
 
     # Animated sparkles with different phases
     sparkle_cycle = int((elapsed * 4) % 3)
@@ -1422,9 +1573,10 @@ def show_reprompting_animation(content: str, live: Live, start_time: float):
     # Time elapsed
     reprompt_text.append(f" {elapsed:.1f}s", style=f"dim {TEXT_SECONDARY}")
 
-    # Token count (approximate: 4 chars per token)
+    # Token count, tokenize the whole content unless the caller keeps a count
     if len(content) > 0:
-        token_count = get_token_count(content)
+        if token_count is None:
+            token_count = get_token_count(content)
         reprompt_text.append(f" · {token_count} tokens", style=f"{WARNING_COLOR}")
 
     # Preview of content (last 100 chars)
@@ -1443,7 +1595,7 @@ def show_reprompted_message(
     original: str, reprompted: str, tokens: int = 0, elapsed_time: float = 0.0
 ):
     """Display the original and reprompted messages side by side with token info"""
-    console = Console()
+    console = get_console()
     console.print()
 
     # Header with token and time info
@@ -5,8 +5,52 @@ Conversation management utilities for Claudette
 import os
 import yaml
 from datetime import datetime
+
+try:
+    # LibYAML C bindings, much faster on long conversations
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 from .. import ui
-from .paths import get_conversations_dir, get_paths
+from .paths import get_conversations_dir
+
+# Buffer size for conversation files, large histories are written and read in
+# a few big system calls instead of many 8 KiB ones
+CONVERSATION_BUFFER_SIZE = 1024 * 1024
+
+# Largest conversation file loaded, parsed YAML takes several times its size
+MAX_CONVERSATION_FILE_SIZE = 50 * 1024 * 1024
+
+
+def _serialize_message(msg: dict) -> dict:
+    """
+    Convert a conversation message to JSON-serializable format
+
+    Args:
+        msg: Conversation message
+
+    Returns:
+        Serialized message
+    """
+    serialized_msg = dict(msg)
+    if msg.get("tool_calls"):
+        # Convert tool_calls objects to dictionaries, tool calls loaded from
+        # a file are already dictionaries
+        serialized_msg["tool_calls"] = [
+            (
+                tc
+                if isinstance(tc, dict)
+                else {
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments,
+                    }
+                }
+            )
+            for tc in msg["tool_calls"]
+        ]
+    return serialized_msg
 
 
 def serialize_history(history: list) -> list:
@@ -19,41 +63,7 @@ def serialize_history(history: list) -> list:
     Returns:
         Serialized conversation history
     """
-    serialized = []
-    for msg in history:
-        serialized_msg = {}
-        for key, value in msg.items():
-            if key == "tool_calls":
-                # Convert tool_calls objects to dictionaries
-                serialized_msg[key] = [
-                    (
-                        {
-                            "function": {
-                                "name": (
-                                    tc.function.name
-                                    if hasattr(tc.function, "name")
-                                    else tc["function"]["name"]
-                                ),
-                                "arguments": (
-                                    tc.function.arguments
-                                    if hasattr(tc.function, "arguments")
-                                    else tc["function"]["arguments"]
-                                ),
-                            }
-                        }
-                        if hasattr(tc, "function")
-                        else tc
-                    )
-                    for tc in value
-                ]
-            elif key == "images":
-                # Images are already serializable (list of paths)
-                serialized_msg[key] = value
-            else:
-                # Copy other fields as-is
-                serialized_msg[key] = value
-        serialized.append(serialized_msg)
-    return serialized
+    return [_serialize_message(msg) for msg in history]
 
 
 def save_conversation(conversation_history: list, filename: str = None) -> str | None:
@@ -82,13 +92,22 @@ def save_conversation(conversation_history: list, filename: str = None) -> str |
     filepath = os.path.join(conversations_dir, filename)
 
     try:
-        # Serialize history to YAML-compatible format
-        serialized_history = serialize_history(conversation_history)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(
-                serialized_history, f, default_flow_style=False, allow_unicode=True
-            )
+        with open(
+            filepath, "w", encoding="utf-8", buffering=CONVERSATION_BUFFER_SIZE
+        ) as f:
+            if not conversation_history:
+                yaml.dump([], f, Dumper=YamlDumper)
+            # Block sequence items concatenate into a single list, so messages
+            # are serialized and written one at a time instead of copying the
+            # whole history first
+            for msg in conversation_history:
+                yaml.dump(
+                    [_serialize_message(msg)],
+                    f,
+                    Dumper=YamlDumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
         ui.show_save_confirmation(filepath)
         return filepath
     except Exception as e:
@@ -116,15 +135,19 @@ def load_conversation(filename: str) -> list | None:
     filepath = os.path.join(conversations_dir, filename)
 
     try:
-        if not os.path.exists(filepath):
-            ui.show_error(f"File not found: {filepath}")
-            return None
-
-        with open(filepath, "r", encoding="utf-8") as f:
-            loaded_history = yaml.safe_load(f)
+        with open(
+            filepath, "r", encoding="utf-8", buffering=CONVERSATION_BUFFER_SIZE
+        ) as f:
+            if os.fstat(f.fileno()).st_size > MAX_CONVERSATION_FILE_SIZE:
+                ui.show_error(f"Conversation file too large: {filepath}")
+                return None
+            loaded_history = yaml.load(f, Loader=YamlLoader)
 
         ui.show_load_confirmation(filepath, len(loaded_history))
         return loaded_history
+    except FileNotFoundError:
+        ui.show_error(f"File not found: {filepath}")
+        return None
     except yaml.YAMLError:
         ui.show_error(f"Invalid YAML file: {filepath}")
         return None
@@ -2,26 +2,130 @@
 Git utilities for Claudette
 """
 
+import os
 import subprocess
 
+# Last branch lookup, keyed by the HEAD file it was read for and its mtime
+_branch_cache: dict = {}
 
-def get_git_branch() -> str | None:
+
+def _find_git_entry(path: str) -> str | None:
     """
-    Get the current git branch name.
+    Find the `.git` entry of the repository containing a directory
+
+    Args:
+        path: Directory to start from
 
     Returns:
-        The current branch name or None if not in a git repository
+        Path of the closest `.git` file or directory, or None if there is none
     """
+    while True:
+        entry = os.path.join(path, ".git")
+        if os.path.lexists(entry):
+            return entry
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _run_git_branch() -> str | None:
+    """Ask git for the current branch name"""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             capture_output=True,
             text=True,
+            errors="replace",
             timeout=1,
             check=False,
         )
         if result.returncode == 0:
             return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+    except (subprocess.TimeoutExpired, OSError):
         pass
     return None
+
+
+def _find_head_file(path: str) -> str | None:
+    """
+    Find the HEAD file of the repository containing a directory
+
+    Args:
+        path: Directory to start from
+
+    Returns:
+        Path of the HEAD file, or None if the directory is not in a repository
+
+    Raises:
+        ValueError: If a `.git` file does not point to a git directory
+    """
+    git_dir = os.environ.get("GIT_DIR")
+    if git_dir:
+        return os.path.join(os.path.abspath(git_dir), "HEAD")
+
+    git_entry = _find_git_entry(path)
+    if git_entry is None:
+        return None
+    if os.path.isdir(git_entry):
+        return os.path.join(git_entry, "HEAD")
+
+    # Worktrees and submodules use a `.git` file: "gitdir: <path>"
+    with open(git_entry, "r", encoding="utf-8") as f:
+        line = f.readline().strip()
+    if not line.startswith("gitdir:"):
+        raise ValueError(f"Unsupported .git file: {git_entry}")
+    git_dir = line[len("gitdir:") :].strip()
+    return os.path.join(os.path.dirname(git_entry), git_dir, "HEAD")
+
+
+def _read_head_branch(head: str) -> str | None:
+    """
+    Read the branch name from a HEAD file
+
+    Args:
+        head: Path of the HEAD file
+
+    Returns:
+        The branch name, "HEAD" when detached (as `git rev-parse --abbrev-ref`
+        prints it), or None if the HEAD file needs git to be understood
+    """
+    with open(head, "r", encoding="utf-8") as f:
+        content = f.read().strip()
+    if not content.startswith("ref:"):
+        return "HEAD"
+    ref = content[len("ref:") :].strip()
+    # The reftable backend leaves a placeholder ref in HEAD
+    if not ref.startswith("refs/heads/") or ref == "refs/heads/.invalid":
+        return None
+    return ref[len("refs/heads/") :]
+
+
+def get_git_branch() -> str | None:
+    """
+    Get the current git branch name.
+
+    The branch is read from the repository HEAD file, git is only run for
+    layouts the file does not describe on its own. The result is reused until
+    the HEAD file or its modification time changes.
+
+    Returns:
+        The current branch name or None if not in a git repository
+    """
+    try:
+        head = _find_head_file(os.getcwd())
+        if head is None:
+            return None
+        key = (head, os.stat(head).st_mtime_ns)
+        if key in _branch_cache:
+            return _branch_cache[key]
+        branch = _read_head_branch(head)
+    except (OSError, ValueError):
+        # Let git make sense of unusual layouts
+        return _run_git_branch()
+
+    if branch is None:
+        branch = _run_git_branch()
+    _branch_cache.clear()
+    _branch_cache[key] = branch
+    return branch
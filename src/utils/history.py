@@ -0,0 +1,49 @@
+"""
+Prompt history storage for Claudette
+"""
+
+import atexit
+from datetime import datetime
+
+from prompt_toolkit.history import FileHistory
+
+
+class BufferedFileHistory(FileHistory):
+    """
+    FileHistory writing new entries in batches
+
+    Entries are kept in memory and appended to the file every `flush_every`
+    entries and when the process exits, in a single write, instead of opening
+    the file for each submitted input. The file format is the one of
+    FileHistory.
+    """
+
+    def __init__(self, filename: str, flush_every: int = 10) -> None:
+        """
+        Initialize the history
+
+        Args:
+            filename: Path of the history file
+            flush_every: Number of entries buffered before they are written
+        """
+        super().__init__(filename)
+        self.flush_every = flush_every
+        self._pending: list[str] = []
+        atexit.register(self.flush)
+
+    def store_string(self, string: str) -> None:
+        """Buffer an entry, writing the buffer once it is full"""
+        lines = [f"\n# {datetime.now()}\n"]
+        lines.extend(f"+{line}\n" for line in string.split("\n"))
+        self._pending.append("".join(lines))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the buffered entries to the history file"""
+        if not self._pending:
+            return
+        pending = "".join(self._pending)
+        self._pending = []
+        with open(self.filename, "ab") as f:
+            f.write(pending.encode("utf-8"))
@@ -2,11 +2,15 @@
 Stats Manager - Track token usage and execution time per model
 """
 
-import os
 import yaml
-from pathlib import Path
 from typing import Dict, Any
 
+try:
+    # LibYAML C bindings, much faster than the pure Python parser and emitter
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 from .paths import get_stats_path
 
 
@@ -28,7 +32,7 @@ class StatsManager:
         """Read stats from YAML file"""
         try:
             with open(self.stats_file, "r", encoding="utf-8") as f:
-                stats = yaml.safe_load(f)
+                stats = yaml.load(f, Loader=YamlLoader)
                 return stats if stats else {}
         except Exception:
             return {}
@@ -40,6 +44,7 @@ class StatsManager:
                 yaml.dump(
                     stats,
                     f,
+                    Dumper=YamlDumper,
                     default_flow_style=False,
                     allow_unicode=True,
                     sort_keys=False,
@@ -0,0 +1,99 @@
+"""
+Tests for the conversation history bounds of ChatBot
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src import ui
+from src.chatbot import HISTORY_CONTEXT_RATIO, HISTORY_TRIM_TARGET_RATIO, ChatBot
+
+
+@pytest.fixture(autouse=True)
+def character_token_count(monkeypatch):
+    """Count one token per character so budgets are easy to reason about"""
+    monkeypatch.setattr(ui, "get_token_count", len)
+
+
+def make_chatbot(max_token_context: int, turn_sizes: list[int]) -> ChatBot:
+    """Build a chatbot whose history holds one turn per given content size"""
+    model = SimpleNamespace(tool_executor=None, max_token_context=max_token_context)
+    chatbot = ChatBot(model)
+    chatbot.conversation_history = [{"role": "system", "content": "system"}]
+    for turn, size in enumerate(turn_sizes):
+        chatbot.conversation_history += [
+            {"role": "user", "content": f"question {turn}"},
+            {"role": "assistant", "content": "x" * size},
+        ]
+    return chatbot
+
+
+def kept_turns(chatbot: ChatBot) -> list[str]:
+    """User messages left in the history"""
+    return [
+        msg["content"]
+        for msg in chatbot.conversation_history
+        if msg["role"] == "user"
+    ]
+
+
+def test_turn_cap_applies_under_budget():
+    chatbot = make_chatbot(1_000_000, [10] * 20)
+
+    chatbot.compact_history()
+
+    assert kept_turns(chatbot) == [f"question {turn}" for turn in range(14, 20)]
+    assert chatbot.conversation_history[0]["role"] == "system"
+
+
+def test_turn_cap_applies_when_only_an_old_turn_exceeds_budget():
+    # Only the first turn is huge: dropping it is enough to fit the budget,
+    # but the turn cap must still keep no more than max_turns turns
+    chatbot = make_chatbot(10_000, [100_000] + [10] * 19)
+
+    chatbot.compact_history()
+
+    assert kept_turns(chatbot) == [
+        f"question {turn}" for turn in range(20 - chatbot.max_turns, 20)
+    ]
+
+
+def test_budget_drops_recent_turns_within_turn_cap():
+    max_token_context = 10_000
+    budget = int(max_token_context * HISTORY_CONTEXT_RATIO)
+    chatbot = make_chatbot(max_token_context, [10] * 14 + [budget // 3] * 6)
+
+    chatbot.compact_history()
+
+    turns = kept_turns(chatbot)
+    assert 1 <= len(turns) < chatbot.max_turns
+    assert turns[-1] == "question 19"
+    assert sum(chatbot._get_message_token_counts()) <= budget
+
+
+def test_budget_trims_down_to_target_so_next_turns_fit():
+    max_token_context = 10_000
+    budget = int(max_token_context * HISTORY_CONTEXT_RATIO)
+    target = int(max_token_context * HISTORY_TRIM_TARGET_RATIO)
+    chatbot = make_chatbot(max_token_context, [1_000] * 4)
+    chatbot.conversation_history += [
+        {"role": "user", "content": "question 4"},
+        {"role": "assistant", "content": "x" * 5_000},
+    ]
+
+    removed = chatbot.compact_history()
+
+    assert removed > 0
+    assert sum(chatbot._get_message_token_counts()) <= target
+
+    # A small turn added after the trim fits under the budget: the history is
+    # left untouched, so its prefix stays identical
+    history = list(chatbot.conversation_history)
+    chatbot.conversation_history += [
+        {"role": "user", "content": "question 5"},
+        {"role": "assistant", "content": "x" * 1_500},
+    ]
+    assert sum(chatbot._get_message_token_counts()) <= budget
+    assert chatbot.compact_history() == 0
+    assert chatbot.conversation_history[: len(history)] == history
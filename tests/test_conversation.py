@@ -0,0 +1,75 @@
+"""
+Tests for saving and loading conversations
+"""
+
+import base64
+
+import pytest
+from ollama import Message
+
+from src.utils import conversation
+from src.utils.conversation import (
+    load_conversation,
+    save_conversation,
+    serialize_history,
+)
+
+
+@pytest.fixture(autouse=True)
+def conversations_dir(tmp_path, monkeypatch):
+    """Save conversations to a temporary directory"""
+    monkeypatch.setattr(conversation, "get_conversations_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_conversation_round_trip():
+    image = base64.b64encode(bytes(range(256))).decode("ascii")
+    history = [
+        {"role": "system", "content": "You are helpful.\nBe brief."},
+        {"role": "user", "content": "What is in this picture?", "images": [image]},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                Message.ToolCall(
+                    function=Message.ToolCall.Function(
+                        name="read_file", arguments={"path": "notes: todo.md"}
+                    )
+                ),
+                {"function": {"name": "get_current_time", "arguments": {}}},
+            ],
+        },
+        {"role": "tool", "content": "- item: one\n- ünicode ✨"},
+        {"role": "assistant", "content": "Done."},
+    ]
+
+    assert save_conversation(history, "round_trip") is not None
+    loaded = load_conversation("round_trip")
+
+    assert loaded == serialize_history(history)
+    assert loaded[1]["images"] == [image]
+    assert loaded[2]["tool_calls"][0] == {
+        "function": {"name": "read_file", "arguments": {"path": "notes: todo.md"}}
+    }
+
+
+def test_empty_conversation_round_trip():
+    save_conversation([], "empty")
+
+    assert load_conversation("empty") == []
+
+
+def test_oversized_conversation_is_not_loaded(conversations_dir, monkeypatch):
+    save_conversation([{"role": "user", "content": "x" * 1000}], "big")
+    assert load_conversation("big") is not None
+
+    monkeypatch.setattr(conversation, "MAX_CONVERSATION_FILE_SIZE", 100)
+    assert load_conversation("big") is None
+
+
+def test_file_over_50_mib_is_rejected_before_parsing(conversations_dir):
+    # Sparse file: the size check happens before anything is read
+    with open(conversations_dir / "huge.yaml", "wb") as f:
+        f.truncate(50 * 1024 * 1024 + 1)
+
+    assert load_conversation("huge") is None
@@ -0,0 +1,124 @@
+"""
+Tests for the git branch lookup
+"""
+
+import os
+
+import pytest
+
+from src.utils import git
+from src.utils.git import get_git_branch
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture(autouse=True)
+def isolated_lookup(monkeypatch):
+    """Start without cached branches, GIT_DIR or git subprocesses"""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.setattr(git, "_branch_cache", {})
+    calls = []
+    monkeypatch.setattr(git, "_run_git_branch", lambda: calls.append(1) or "from-git")
+    return calls
+
+
+def write_head(git_dir, content: str):
+    """Create a git directory whose HEAD holds the given content"""
+    git_dir.mkdir(parents=True, exist_ok=True)
+    (git_dir / "HEAD").write_text(content + "\n", encoding="utf-8")
+
+
+def test_repository_root_and_subdirectory(tmp_path, monkeypatch, isolated_lookup):
+    write_head(tmp_path / "repo" / ".git", "ref: refs/heads/feature/x")
+    subdir = tmp_path / "repo" / "src" / "deep"
+    subdir.mkdir(parents=True)
+
+    monkeypatch.chdir(tmp_path / "repo")
+    assert get_git_branch() == "feature/x"
+    monkeypatch.chdir(subdir)
+    assert get_git_branch() == "feature/x"
+    assert isolated_lookup == []
+
+
+def test_worktree(tmp_path, monkeypatch):
+    write_head(tmp_path / "repo" / ".git", "ref: refs/heads/main")
+    write_head(tmp_path / "repo" / ".git" / "worktrees" / "wt", "ref: refs/heads/other")
+    (tmp_path / "wt").mkdir()
+    (tmp_path / "wt" / ".git").write_text(
+        f"gitdir: {tmp_path / 'repo' / '.git' / 'worktrees' / 'wt'}\n"
+    )
+
+    monkeypatch.chdir(tmp_path / "wt")
+    assert get_git_branch() == "other"
+
+
+def test_submodule_with_relative_gitdir(tmp_path, monkeypatch):
+    write_head(tmp_path / "repo" / ".git", "ref: refs/heads/main")
+    write_head(tmp_path / "repo" / ".git" / "modules" / "lib", "ref: refs/heads/lib-main")
+    (tmp_path / "repo" / "lib").mkdir()
+    (tmp_path / "repo" / "lib" / ".git").write_text("gitdir: ../.git/modules/lib\n")
+
+    monkeypatch.chdir(tmp_path / "repo" / "lib")
+    assert get_git_branch() == "lib-main"
+
+
+def test_git_dir_environment_variable(tmp_path, monkeypatch):
+    write_head(tmp_path / "elsewhere.git", "ref: refs/heads/from-env")
+    (tmp_path / "work").mkdir()
+    monkeypatch.setenv("GIT_DIR", str(tmp_path / "elsewhere.git"))
+
+    monkeypatch.chdir(tmp_path / "work")
+    assert get_git_branch() == "from-env"
+
+
+def test_detached_head(tmp_path, monkeypatch):
+    write_head(tmp_path / ".git", SHA)
+
+    monkeypatch.chdir(tmp_path)
+    assert get_git_branch() == "HEAD"
+
+
+def test_reftable_placeholder_asks_git(tmp_path, monkeypatch, isolated_lookup):
+    write_head(tmp_path / ".git", "ref: refs/heads/.invalid")
+
+    monkeypatch.chdir(tmp_path)
+    assert get_git_branch() == "from-git"
+    assert isolated_lookup == [1]
+
+
+def test_unsupported_git_file_asks_git(tmp_path, monkeypatch, isolated_lookup):
+    (tmp_path / ".git").write_text("not a gitdir line\n")
+
+    monkeypatch.chdir(tmp_path)
+    assert get_git_branch() == "from-git"
+    assert isolated_lookup == [1]
+
+
+def test_outside_a_repository(tmp_path, monkeypatch):
+    monkeypatch.setattr(git, "_find_git_entry", lambda path: None)
+
+    monkeypatch.chdir(tmp_path)
+    assert get_git_branch() is None
+
+
+def test_cache_follows_head_modification_time(tmp_path, monkeypatch):
+    write_head(tmp_path / ".git", "ref: refs/heads/main")
+    head = tmp_path / ".git" / "HEAD"
+    reads = []
+    read_head_branch = git._read_head_branch
+    monkeypatch.setattr(
+        git, "_read_head_branch", lambda path: reads.append(path) or read_head_branch(path)
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert get_git_branch() == "main"
+    assert get_git_branch() == "main"
+    assert len(reads) == 1
+
+    # Checkout: HEAD is rewritten with a new modification time
+    mtime_ns = head.stat().st_mtime_ns
+    head.write_text("ref: refs/heads/next\n")
+    os.utime(head, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+    assert get_git_branch() == "next"
+    assert len(reads) == 2
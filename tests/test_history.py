@@ -0,0 +1,53 @@
+"""
+Tests for the buffered prompt history file
+"""
+
+from prompt_toolkit.history import FileHistory
+
+from src.utils.history import BufferedFileHistory
+
+
+def reload(path) -> list[str]:
+    """Entries of a history file as prompt_toolkit reads them, oldest first"""
+    return list(reversed(list(FileHistory(str(path)).load_history_strings())))
+
+
+def test_entries_are_written_once_the_buffer_is_full(tmp_path):
+    path = tmp_path / "history"
+    history = BufferedFileHistory(str(path), flush_every=3)
+
+    history.append_string("first")
+    history.append_string("second")
+    assert not path.exists()
+
+    history.append_string("third")
+    assert reload(path) == ["first", "second", "third"]
+
+
+def test_flush_writes_pending_entries(tmp_path):
+    path = tmp_path / "history"
+    history = BufferedFileHistory(str(path), flush_every=10)
+
+    history.append_string("only")
+    history.flush()
+    assert reload(path) == ["only"]
+
+    # Nothing left to write: a second flush does not duplicate entries
+    history.flush()
+    assert reload(path) == ["only"]
+
+
+def test_output_reloads_with_file_history(tmp_path):
+    path = tmp_path / "history"
+    FileHistory(str(path)).append_string("from before")
+
+    history = BufferedFileHistory(str(path), flush_every=2)
+    entries = ["single line", "multi\nline entry", "ünicode ✨", "last"]
+    for entry in entries:
+        history.append_string(entry)
+    history.flush()
+
+    assert reload(path) == ["from before", *entries]
+    assert list(BufferedFileHistory(str(path)).load_history_strings()) == list(
+        reversed(["from before", *entries])
+    )
@@ -0,0 +1,41 @@
+"""
+Tests for the shared event loop runner
+"""
+
+import asyncio
+
+import pytest
+
+from src import models
+from src.models import run_async
+
+
+def interrupt():
+    raise KeyboardInterrupt
+
+
+def test_interrupt_cancels_the_running_coroutine():
+    events = []
+
+    async def stream():
+        asyncio.get_running_loop().call_later(0.01, interrupt)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        events.append("resumed")
+
+    with pytest.raises(KeyboardInterrupt):
+        run_async(stream())
+
+    assert events == ["cancelled"]
+    assert not asyncio.all_tasks(models._event_loop)
+
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    # The loop stays usable, and the cancelled coroutine never resumes on it
+    assert run_async(answer()) == 42
+    assert events == ["cancelled"]